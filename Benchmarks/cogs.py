@@ -0,0 +1,275 @@
+"""Runs every cog's slash commands against recorded upstream payloads
+
+Each case is invoked through RinCore the same way a gateway interaction
+would be, with Discord and every upstream API served by the local stub in
+Benchmarks/stub.py, so no network access is needed. Reports latency,
+memory allocated per invocation and throughput for each command:
+
+    python Benchmarks/cogs.py --rounds 50 --concurrency 16 --cache cold
+
+Save a run with ``--save baseline.json``, then pass ``--compare
+baseline.json`` on a later run to exit with a non-zero status if any
+command got slower than ``--tolerance`` allows, which is what releases are
+gated on.
+"""
+
+import argparse
+import asyncio
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from stub import StubServer, createBot, invoke, releaseViews
+
+# (qualified command name, options). Reddit, Twitter and the meme API are
+# left out, as those go through asyncpraw or need recorded OAuth exchanges
+CASES: List[Tuple[str, Dict[str, Any]]] = [
+    ("advice", {}),
+    ("anilist search anime", {"anime_name": "rin"}),
+    ("anilist search manga", {"manga_name": "rin"}),
+    ("anilist search tags", {"tags": "Isekai"}),
+    ("anilist search users", {"user": "rin"}),
+    ("anilist search characters", {"anime_character": "rin"}),
+    ("anilist search actors", {"voice_actor": "kana"}),
+    ("blue-alliance teams info", {"team_number": 1678}),
+    ("blue-alliance teams events", {"team_number": 1678}),
+    (
+        "blue-alliance matches team",
+        {"team_number": 1678, "event_key": "2022cada"},
+    ),
+    ("blue-alliance matches all", {"frc_event_key": "2022cada"}),
+    ("blue-alliance rankings", {"frc_event_key": "2022cada"}),
+    ("github search repos", {"repo": "rin"}),
+    ("github search users", {"user": "someone"}),
+    ("github issues all", {"owner": "someone", "repo": "Rin", "state": "Open"}),
+    ("github issues one", {"owner": "someone", "repo": "Rin", "issue_number": "400"}),
+    ("github releases list", {"owner": "someone", "repo": "Rin"}),
+    ("github releases latest", {"owner": "someone", "repo": "Rin"}),
+    ("github repo", {"owner": "someone", "repo": "Rin"}),
+    ("github user one", {"username": "someone"}),
+    ("jisho search", {"search": "rin"}),
+    ("mal search anime", {"anime_name": "rin"}),
+    ("mal search manga", {"manga_name": "rin"}),
+    ("mal random anime", {}),
+    ("mal random manga", {}),
+    ("mal seasons list", {"year": 2022, "season": "Spring"}),
+    ("mal seasons upcoming", {}),
+    ("mal user", {"username": "rin"}),
+    ("mangadex search manga", {"name": "rin"}),
+    ("mangadex random", {}),
+    ("mangadex search scanlation", {"name": "rin"}),
+    ("mangadex search author", {"author_name": "rin"}),
+    ("minecraft java", {"server": "mc.hypixel.net"}),
+    ("minecraft bedrock", {"server": "play.rin.example"}),
+    ("modrinth search", {"mod": "rin", "modloader": "Forge"}),
+    ("modrinth mod list", {"name": "rin", "modloader": "Forge"}),
+    (
+        "modrinth versions all",
+        {"name": "rin", "game_version": "1.19.2", "loaders": "Forge"},
+    ),
+    ("modrinth user search", {"username": "modder0"}),
+    ("modrinth user projects", {"username": "modder0"}),
+    ("spigot search", {"name": "rin"}),
+    ("tenor search multiple", {"search_term": "rin"}),
+    ("tenor search one", {"search": "rin"}),
+    ("tenor featured", {}),
+    ("tenor search suggestions", {"search_suggestion": "rin"}),
+    ("tenor trending terms", {}),
+    ("tenor random", {"search_random_term": "rin"}),
+    ("waifu random one", {}),
+    ("waifu random many", {}),
+    ("waifu pics", {}),
+    ("youtube search", {"search": "rin"}),
+    ("youtube channel", {"channel": "rin"}),
+    ("youtube playlist", {"channel_name": "rin"}),
+]
+
+
+# The cogs catch their own errors and answer with an embed saying so, which
+# has a description and nothing else. The failure handler's has a title
+ERROR_DESCRIPTION = re.compile(
+    r"try again|went wrong|error|not successful|no \w+ found", re.IGNORECASE
+)
+ERROR_TITLE = "An error has occured"
+
+
+def findError(responses: List[Dict]) -> Optional[str]:
+    """What went wrong, if a command answered with an error embed or never answered"""
+    if not any(
+        response.get("embeds") or response.get("content") for response in responses
+    ):
+        return "nothing was sent back"
+    for response in responses:
+        for embed in response.get("embeds") or ():
+            title, description = embed.get("title"), embed.get("description") or ""
+            if title == ERROR_TITLE:
+                return "sent the failure handler's embed"
+            if (
+                not title
+                and not embed.get("fields")
+                and ERROR_DESCRIPTION.search(description)
+            ):
+                return f"sent an error embed: {description}"
+    return None
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def runOnce(bot, server, name: str, options: Dict, cold: bool) -> float:
+    if cold:
+        await bot.cache.clear()
+    start = time.perf_counter()
+    interaction, error = await invoke(bot, name, options)
+    elapsed = time.perf_counter() - start
+    responses = server.popResponses(interaction.token)
+    releaseViews(bot)
+    if error is not None:
+        raise RuntimeError(f"{name} failed: {error!r}") from error
+    problem = findError(responses)
+    if problem is not None:
+        raise RuntimeError(f"{name} {problem}")
+    return elapsed
+
+
+async def measureAllocations(
+    bot, server, name: str, options: Dict, cold: bool, rounds: int
+) -> float:
+    """Median peak of memory allocated while a single invocation runs, in KiB"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(rounds):
+            if cold:
+                await bot.cache.clear()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await runOnce(bot, server, name, options, cold=False)
+            peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(peaks)
+
+
+async def measureThroughput(
+    bot, server, name: str, options: Dict, cold: bool, total: int, concurrency: int
+) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def worker():
+        async with sem:
+            await runOnce(bot, server, name, options, cold)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def runCase(bot, server, name: str, options: Dict, args) -> Dict[str, float]:
+    cold = args.cache == "cold"
+    # The first run primes the connection pool, and the cache for warm runs
+    await runOnce(bot, server, name, options, cold)
+    latencies = [
+        await runOnce(bot, server, name, options, cold) for _ in range(args.rounds)
+    ]
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "alloc_kib": await measureAllocations(
+            bot, server, name, options, cold, max(args.rounds // 5, 3)
+        ),
+        "throughput": await measureThroughput(
+            bot, server, name, options, cold, args.rounds, args.concurrency
+        ),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Lists every command whose latency or throughput regressed past the tolerance"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if result["p50_ms"] > previous["p50_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50 {previous['p50_ms']:.2f}ms -> {result['p50_ms']:.2f}ms"
+            )
+        if result["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {previous['throughput']:.1f}/s -> {result['throughput']:.1f}/s"
+            )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    server = StubServer(latency=args.latency)
+    await server.start()
+    bot = await createBot(server)
+    cases = [case for case in CASES if not args.only or case[0].startswith(args.only)]
+    results: Dict[str, Dict[str, float]] = {}
+    failures: Dict[str, str] = {}
+    print(
+        f"{len(cases)} commands, {args.rounds} rounds, concurrency {args.concurrency}, "
+        f"{args.cache} cache, {args.latency * 1000:.0f}ms upstream latency"
+    )
+    try:
+        for name, options in cases:
+            try:
+                result = results[name] = await runCase(bot, server, name, options, args)
+            except RuntimeError as e:
+                failures[name] = str(e)
+                print(f"{name:<32} FAILED {e}")
+                continue
+            print(
+                f"{name:<32} p50 {result['p50_ms']:>7.2f}ms  "
+                f"p95 {result['p95_ms']:>7.2f}ms  "
+                f"alloc {result['alloc_kib']:>8.1f}KiB  "
+                f"{result['throughput']:>8.1f} cmd/s"
+            )
+    finally:
+        await bot.close()
+        await server.close()
+
+    if server.unmatched:
+        print(f"Requests without a fixture: {server.unmatched}")
+    if args.save:
+        Path(args.save).write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    status = 1 if failures else 0
+    if args.compare:
+        regressions = compare(
+            results, orjson.loads(Path(args.compare).read_bytes()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--cache", choices=["cold", "warm"], default="cold")
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Seconds added to every upstream call"
+    )
+    parser.add_argument("--only", help="Only run commands starting with this name")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Fail on regressions against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    sys.exit(asyncio.run(main(parser.parse_args())))
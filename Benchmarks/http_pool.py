@@ -0,0 +1,105 @@
+"""Compares a fresh aiohttp session per request against RinCore's shared pool
+
+A local stub server stands in for the upstream APIs, so this can be run
+without any network access:
+
+    python Benchmarks/http_pool.py --requests 500 --concurrency 25
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import orjson
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.http import createSession  # noqa: E402
+
+PAYLOAD = orjson.dumps({"slip": {"id": 1, "advice": "Always bench before tuning."}})
+
+
+async def startStubServer() -> web.AppRunner:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=PAYLOAD, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/advice", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", 0).start()
+    return runner
+
+
+async def perRequestSession(url: str) -> None:
+    async with aiohttp.ClientSession(json_serialize=orjson.dumps) as session:
+        async with session.get(url) as r:
+            await r.content.read()
+
+
+async def sharedSession(session: aiohttp.ClientSession, url: str) -> None:
+    async with session.get(url) as r:
+        await r.content.read()
+
+
+async def runScenario(name: str, fetch, total: int, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def worker():
+        async with sem:
+            start = time.perf_counter()
+            await fetch()
+            latencies.append(time.perf_counter() - start)
+
+    cpuStart = time.process_time()
+    wallStart = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(total)))
+    wall = time.perf_counter() - wallStart
+    cpu = time.process_time() - cpuStart
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<22} {total / wall:>9.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:>7.2f}ms  "
+        f"p99 {p99 * 1000:>7.2f}ms  "
+        f"cpu {cpu * 1000 / total:>6.3f}ms/req"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    runner = await startStubServer()
+    port = runner.addresses[0][1]
+    url = f"http://localhost:{port}/advice"
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, stub at {url}")
+    await runScenario(
+        "session per request",
+        lambda: perRequestSession(url),
+        args.requests,
+        args.concurrency,
+    )
+    session = createSession()
+    try:
+        await runScenario(
+            "shared RinCore pool",
+            lambda: sharedSession(session, url),
+            args.requests,
+            args.concurrency,
+        )
+    finally:
+        await session.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=25)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,175 @@
+"""Compares materializing whole responses against picking the fields an embed shows
+
+Each case replays a payload from Benchmarks/fixtures and reads the same
+fields a cog does, once through ``Response.data`` and once through
+``Response.pick`` / ``Response.pickItems``. Reports the CPU time per response
+and the peak Python memory allocated while reading it:
+
+    python Benchmarks/json_access.py --rounds 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from multidict import CIMultiDict
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.http import Response  # noqa: E402
+
+FIXTURES = Path(__file__).parent.joinpath("fixtures")
+
+MCSRVSTAT_FILTER = ["motd", "debug", "icon", "players", "hostname"]
+GITHUB_REPO_NESTED = [
+    "permissions",
+    "owner",
+    "template_repository",
+    "organization",
+    "source",
+    "parent",
+    "license",
+]
+GITHUB_USER_FILTER = ["name", "bio", "login", "gravatar_id", "avatar_url", "plan"]
+
+
+def urlKeys(body: bytes) -> list:
+    return [
+        key for key in Response(200, CIMultiDict(), body).data if key.endswith("_url")
+    ]
+
+
+def adviceFull(r: Response) -> None:
+    r.data["slip"]["advice"]
+
+
+def adviceLazy(r: Response) -> None:
+    r.pick("/slip/advice")
+
+
+def waifuPicsFull(r: Response) -> None:
+    r.data["url"]
+
+
+def waifuPicsLazy(r: Response) -> None:
+    r.pick("/url")
+
+
+def mcsrvstatFull(r: Response) -> None:
+    data = r.data
+    data["online"]
+    {key: val for key, val in data.items() if key not in MCSRVSTAT_FILTER}
+    dict(data["players"])
+    data["hostname"]
+    data["motd"]["clean"]
+
+
+def mcsrvstatLazy(r: Response) -> None:
+    r.pick("/online")
+    r.pickItems(exclude=MCSRVSTAT_FILTER)
+    r.pick("/players", "/hostname", "/motd/clean")
+
+
+def githubRepoFull(r: Response, exclude: list) -> None:
+    data = r.data
+    {key: val for key, val in data.items() if key not in exclude}
+    {key: val for key, val in data["license"].items()}
+    data["created_at"], data["updated_at"], data["pushed_at"]
+    data["name"], data["description"], data["owner"]["avatar_url"]
+
+
+def githubRepoLazy(r: Response, exclude: list) -> None:
+    r.pickItems(exclude=exclude)
+    r.pickItems("/license")
+    r.pick(
+        "/created_at",
+        "/updated_at",
+        "/pushed_at",
+        "/name",
+        "/description",
+        "/owner/avatar_url",
+    )
+
+
+def githubUserFull(r: Response, exclude: list) -> None:
+    data = r.data
+    {key: val for key, val in data.items() if key not in exclude}
+    data["login"], data["name"], data["bio"], data["avatar_url"]
+
+
+def githubUserLazy(r: Response, exclude: list) -> None:
+    r.pickItems(exclude=exclude)
+    r.pick("/login", "/name", "/bio", "/avatar_url")
+
+
+def mangadexFull(r: Response) -> None:
+    data = r.data
+    data["chapter"]["hash"], list(data["chapter"]["data"])
+
+
+def mangadexLazy(r: Response) -> None:
+    r.pick("/chapter/hash", "/chapter/data")
+
+
+def loadCases() -> list:
+    repo = FIXTURES.joinpath("github_repo.json").read_bytes()
+    user = FIXTURES.joinpath("github_user.json").read_bytes()
+    repoFilter = GITHUB_REPO_NESTED + urlKeys(repo)
+    userFilter = GITHUB_USER_FILTER + urlKeys(user)
+    return [
+        ("adviceslip", adviceFull, adviceLazy),
+        ("waifu_pics", waifuPicsFull, waifuPicsLazy),
+        ("mcsrvstat_java", mcsrvstatFull, mcsrvstatLazy),
+        (
+            "github_repo",
+            lambda r: githubRepoFull(r, repoFilter),
+            lambda r: githubRepoLazy(r, repoFilter),
+        ),
+        (
+            "github_user",
+            lambda r: githubUserFull(r, userFilter),
+            lambda r: githubUserLazy(r, userFilter),
+        ),
+        ("mangadex_at_home", mangadexFull, mangadexLazy),
+    ]
+
+
+def measure(read, body: bytes, rounds: int) -> tuple:
+    responses = [Response(200, CIMultiDict(), body) for _ in range(rounds)]
+    start = time.process_time()
+    for r in responses:
+        read(r)
+    elapsed = (time.process_time() - start) / rounds
+
+    r = Response(200, CIMultiDict(), body)
+    tracemalloc.start()
+    read(r)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"{args.rounds} rounds per case")
+    print(
+        f"{'payload':<18}{'size':>9}  {'data':>10}{'pick':>10}  "
+        f"{'data peak':>11}{'pick peak':>11}"
+    )
+    for name, full, lazy in loadCases():
+        body = FIXTURES.joinpath(f"{name}.json").read_bytes()
+        fullTime, fullPeak = measure(full, body, args.rounds)
+        lazyTime, lazyPeak = measure(lazy, body, args.rounds)
+        print(
+            f"{name:<18}{len(body) / 1024:>7.1f}KiB  "
+            f"{fullTime * 1e6:>8.1f}us{lazyTime * 1e6:>8.1f}us  "
+            f"{fullPeak / 1024:>9.1f}KiB{lazyPeak / 1024:>9.1f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
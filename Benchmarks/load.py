@@ -0,0 +1,222 @@
+"""Load tests RinCore by feeding it synthetic interactions at a fixed rate
+
+The bot is built with the cogs exactly as ``RinCore.loadCogs`` loads them,
+and every interaction goes in through the gateway's INTERACTION_CREATE
+parser, so it takes the same path through py-cord (and Rin's deferral,
+metrics and tracing) as one from Discord would. Discord's REST API and the
+upstreams are served by the stub in Benchmarks/stub.py:
+
+    python Benchmarks/load.py --rate 200 --duration 10 --latency 0.05
+
+Interactions are dispatched open loop, so a slow bot builds up a backlog
+rather than slowing the dispatcher down. Reports p50/p99 latency to the
+first response and to completion, along with how far behind the event loop
+fell while under load, and which commands RinCore's loop monitor caught
+blocking it.
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import discord
+import orjson
+from cogs import CASES, percentile
+from stub import StubServer, buildInteraction, createBot, findCommand, releaseViews
+
+
+class LoopLagSampler:
+    """Measures how late the event loop wakes up a task that sleeps for ``interval``"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(time.perf_counter() - start - self.interval, 0))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class Harness:
+    """Dispatches interactions into the bot and keeps track of when each one finishes"""
+
+    def __init__(self, bot, server: StubServer):
+        self.bot = bot
+        self.server = server
+        self.pending: Dict[int, Tuple[str, float, asyncio.Future]] = {}
+        self.errors: Dict[str, int] = {}
+        bot.auto_sync_commands = False
+        bot.add_listener(self._onCompletion, "on_application_command_completion")
+        bot.add_listener(self._onError, "on_application_command_error")
+        self._registerCommands()
+
+    def _registerCommands(self) -> None:
+        """Gives every command an ID, the way syncing them with Discord would
+
+        py-cord looks commands up by the ID in the interaction, and falls back
+        to a linear search when it can't find one.
+        """
+        ids = itertools.count(1300000000000000000)
+        for command in self.bot.pending_application_commands:
+            command.id = next(ids)
+            self.bot._application_commands[command.id] = command
+
+    def _finish(self, ctx: discord.ApplicationContext, error: Optional[str]) -> None:
+        entry = self.pending.get(ctx.interaction.id)
+        if entry is not None and not entry[2].done():
+            entry[2].set_result((time.perf_counter(), error))
+
+    async def _onCompletion(self, ctx: discord.ApplicationContext) -> None:
+        self._finish(ctx, None)
+
+    async def _onError(self, ctx: discord.ApplicationContext, error: Exception) -> None:
+        self._finish(ctx, type(getattr(error, "original", error)).__name__)
+
+    def dispatch(self, name: str, options: Dict[str, Any]) -> None:
+        """Hands an interaction to the bot, just as the gateway would on INTERACTION_CREATE"""
+        _, payload = buildInteraction(self.bot, name, options)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[int(payload["id"])] = (
+            payload["token"],
+            time.perf_counter(),
+            future,
+        )
+        self.bot._connection.parsers["INTERACTION_CREATE"](payload)
+
+    async def collect(self, timeout: float) -> Tuple[List[float], List[float], int]:
+        """Waits for every dispatched interaction, returning response and completion latencies"""
+        futures = [entry[2] for entry in self.pending.values()]
+        if futures:
+            await asyncio.wait(futures, timeout=timeout)
+        responses, completions, timedOut = [], [], 0
+        for token, start, future in self.pending.values():
+            respondedAt = self.server.respondedAt.get(token)
+            self.server.popResponses(token)
+            if respondedAt is not None:
+                responses.append(respondedAt - start)
+            if not future.done():
+                timedOut += 1
+                continue
+            finishedAt, error = future.result()
+            if error is not None:
+                self.errors[error] = self.errors.get(error, 0) + 1
+            completions.append(finishedAt - start)
+        self.pending.clear()
+        return responses, completions, timedOut
+
+
+def describe(label: str, values: List[float]) -> str:
+    if not values:
+        return f"{label:<12} no samples"
+    return (
+        f"{label:<12} p50 {statistics.median(values) * 1000:>8.2f}ms  "
+        f"p99 {percentile(values, 0.99) * 1000:>8.2f}ms  "
+        f"max {max(values) * 1000:>8.2f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.command:
+        cases = [(args.command, orjson.loads(args.options))]
+    else:
+        cases = [
+            case for case in CASES if not args.only or case[0].startswith(args.only)
+        ]
+    server = StubServer(latency=args.latency)
+    await server.start()
+    bot = await createBot(server)
+    try:
+        for name, _ in cases:
+            findCommand(bot, name)
+        harness = Harness(bot, server)
+        total = int(args.rate * args.duration)
+        print(
+            f"{total} interactions across {len(cases)} commands at {args.rate:g}/s, "
+            f"{args.latency * 1000:.0f}ms upstream latency"
+        )
+
+        sampler = LoopLagSampler()
+        sampler.start()
+        bot.loopMonitor.start()
+        mix = itertools.cycle(cases)
+        start = time.perf_counter()
+        for i in range(total):
+            delay = start + i / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            harness.dispatch(*next(mix))
+        dispatchTime = time.perf_counter() - start
+        responses, completions, timedOut = await harness.collect(args.timeout)
+        elapsed = time.perf_counter() - start
+        await sampler.stop()
+        releaseViews(bot)
+    finally:
+        await bot.close()
+        await server.close()
+
+    print(
+        f"Dispatched in {dispatchTime:.2f}s ({total / dispatchTime:.1f}/s), "
+        f"completed {len(completions)} in {elapsed:.2f}s "
+        f"({len(completions) / elapsed:.1f}/s)"
+    )
+    print(describe("response", responses))
+    print(describe("completion", completions))
+    print(describe("loop lag", sampler.samples))
+    for name, stats in bot.loopMonitor.stats()["commands"].items():
+        print(
+            f"{name} blocked the loop {stats['slow_callbacks']} times, "
+            f"for up to {stats['slowest_ms']:.0f}ms"
+        )
+    if timedOut:
+        print(f"{timedOut} interactions didn't finish within {args.timeout:g}s")
+    for error, count in sorted(harness.errors.items()):
+        print(f"{count} failed with {error}")
+    if server.unmatched:
+        print(f"Requests without a fixture: {server.unmatched}")
+    return 1 if timedOut or harness.errors else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rate", type=float, default=100, help="Interactions per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="Seconds to dispatch for"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Seconds added to every upstream call"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="Seconds to wait for stragglers once dispatching ends",
+    )
+    parser.add_argument("--only", help="Only mix in commands starting with this name")
+    parser.add_argument(
+        "--command",
+        help="Run only this command (its qualified name) instead of the mix",
+    )
+    parser.add_argument(
+        "--options", default="{}", help="JSON object of options for --command"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
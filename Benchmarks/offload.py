@@ -0,0 +1,144 @@
+"""Compares event loop lag with payload transforms run on the loop and in a worker pool
+
+Runs the commands that turn large payloads into pages (Blue Alliance
+matches, MangaDex manga search, GitHub issues and releases, Jisho) through
+RinCore against the stub upstreams in Benchmarks/stub.py, once per offload
+mode, while sampling how late the loop wakes up:
+
+    python Benchmarks/offload.py --requests 120 --concurrency 4 --copies 4
+
+``loop`` keeps every transform on the event loop, as before the offloader,
+while ``thread`` and ``process`` hand every payload to the worker pool.
+``--copies`` repeats the records in each fixture, to stand in for events
+and searches with more results than the recorded ones.
+
+Compare the p50 and p99 lag. The max is usually a full garbage collection
+pass over the parsed payloads, which stalls the loop whichever thread sets
+it off.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import orjson
+from cogs import percentile
+from load import LoopLagSampler
+from stub import StubServer, createBot, invoke, releaseViews
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.offload import OFFLOAD_MODES, Offloader  # noqa: E402
+
+CASES = [
+    ("blue-alliance matches team", {"team_number": 1678, "event_key": "2022cada"}),
+    ("blue-alliance matches all", {"frc_event_key": "2022cada"}),
+    ("mangadex search manga", {"name": "rin"}),
+    ("github issues all", {"owner": "someone", "repo": "Rin", "state": "Open"}),
+    ("github releases list", {"owner": "someone", "repo": "Rin"}),
+    ("jisho search", {"search": "rin"}),
+]
+
+
+def repeatRecords(server: StubServer, copies: int) -> None:
+    """Makes every list of records the stub serves ``copies`` times as long"""
+    routes = []
+    for host, path, match, body in server._routes:
+        data = orjson.loads(body)
+        if isinstance(data, list):
+            data = data * copies
+        elif isinstance(data, dict) and isinstance(data.get("data"), list):
+            data["data"] = data["data"] * copies
+        routes.append((host, path, match, orjson.dumps(data)))
+    server._routes = routes
+
+
+async def runMode(bot, server, mode: str, args) -> Dict[str, float]:
+    bot.offloader.close()
+    if mode == "loop":
+        bot.offloader = Offloader(threshold=sys.maxsize)
+    else:
+        bot.offloader = Offloader(mode, args.workers, threshold=0)
+    sem = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+
+    async def worker(name: str, options: Dict) -> None:
+        async with sem:
+            # A cold cache, so every run parses and transforms its payload
+            await bot.cache.clear()
+            start = time.perf_counter()
+            interaction, error = await invoke(bot, name, options)
+            latencies.append(time.perf_counter() - start)
+            server.popResponses(interaction.token)
+            if error is not None:
+                raise RuntimeError(f"{name} failed: {error!r}") from error
+
+    # Warms up the connection pool and, for processes, spawns the workers
+    await asyncio.gather(*(worker(name, options) for name, options in CASES))
+    latencies.clear()
+
+    sampler = LoopLagSampler(interval=args.interval)
+    sampler.start()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(worker(*CASES[i % len(CASES)]) for i in range(args.requests))
+    )
+    elapsed = time.perf_counter() - start
+    await sampler.stop()
+    releaseViews(bot)
+    return {
+        "lag_p50_ms": statistics.median(sampler.samples) * 1000,
+        "lag_p99_ms": percentile(sampler.samples, 0.99) * 1000,
+        "lag_max_ms": max(sampler.samples) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "throughput": args.requests / elapsed,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = StubServer()
+    await server.start()
+    repeatRecords(server, args.copies)
+    bot = await createBot(server)
+    print(
+        f"{args.requests} commands, concurrency {args.concurrency}, "
+        f"{args.copies}x records, lag sampled every {args.interval * 1000:g}ms"
+    )
+    try:
+        for mode in args.modes:
+            result = await runMode(bot, server, mode, args)
+            print(
+                f"{mode:<8} lag p50 {result['lag_p50_ms']:>6.2f}ms  "
+                f"p99 {result['lag_p99_ms']:>6.2f}ms  "
+                f"max {result['lag_max_ms']:>6.2f}ms  |  "
+                f"command p50 {result['p50_ms']:>7.2f}ms  "
+                f"p99 {result['p99_ms']:>7.2f}ms  "
+                f"{result['throughput']:>7.1f} cmd/s"
+            )
+    finally:
+        bot.offloader.close()
+        await bot.close()
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=120)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--workers", type=int, help="Size of the worker pool")
+    parser.add_argument(
+        "--interval", type=float, default=0.001, help="Seconds between lag samples"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["loop", *OFFLOAD_MODES],
+        default=["loop", *OFFLOAD_MODES],
+    )
+    asyncio.run(main(parser.parse_args()))
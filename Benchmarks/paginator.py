@@ -0,0 +1,109 @@
+"""Compares building every page up front against LazyPaginator's first page
+
+Renders a GitHub issues style result set (25 records with timestamps,
+labels and assignees) both ways and reports the time and memory it takes
+before the first page can be sent:
+
+    python Benchmarks/paginator.py --records 25 --rounds 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import ciso8601
+import discord
+from discord.ext import pages
+from discord.utils import format_dt
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.paginator import LazyPages, LazyPaginator  # noqa: E402
+
+
+def makeRecords(total: int) -> list:
+    return [
+        {
+            "title": f"Issue {i}",
+            "body": "Something broke " * 40,
+            "state": "open",
+            "html_url": f"https://github.com/No767/Rin/issues/{i}",
+            "created_at": "2022-05-04T12:34:56Z",
+            "updated_at": "2022-05-05T01:02:03Z",
+            "labels": [{"name": name} for name in ("bug", "help wanted", "cog")],
+            "assignees": [{"login": f"user{n}"} for n in range(3)],
+            "user": {"login": "No767", "avatar_url": "https://example.com/a.png"},
+        }
+        for i in range(total)
+    ]
+
+
+def renderIssue(item: dict) -> discord.Embed:
+    return (
+        discord.Embed(title=item["title"], description=item["body"])
+        .add_field(name="State", value=item["state"], inline=True)
+        .add_field(name="URL", value=item["html_url"], inline=True)
+        .add_field(
+            name="Created At",
+            value=format_dt(ciso8601.parse_datetime(item["created_at"])),
+            inline=True,
+        )
+        .add_field(
+            name="Updated At",
+            value=format_dt(ciso8601.parse_datetime(item["updated_at"])),
+            inline=True,
+        )
+        .add_field(name="Labels", value=[label["name"] for label in item["labels"]])
+        .add_field(
+            name="Assignees", value=[user["login"] for user in item["assignees"]]
+        )
+        .set_thumbnail(url=item["user"]["avatar_url"])
+    )
+
+
+def eager(records: list) -> pages.Paginator:
+    paginator = pages.Paginator(
+        pages=[renderIssue(item) for item in records], loop_pages=True
+    )
+    paginator.get_page_content(paginator.pages[0])
+    return paginator
+
+
+def lazy(records: list) -> LazyPaginator:
+    paginator = LazyPaginator(pages=LazyPages(records, renderIssue), loop_pages=True)
+    paginator.get_page_content(paginator.pages[0])
+    return paginator
+
+
+def measure(name: str, build, records: list, rounds: int) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build(records)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    paginator = build(records)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del paginator
+    print(
+        f"{name:<16} first page in {elapsed * 1000:>7.3f}ms  "
+        f"holding {current / 1024:>8.1f}KiB"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    records = makeRecords(args.records)
+    print(f"{args.records} records, {args.rounds} rounds")
+    measure("eager Paginator", eager, records, args.rounds)
+    measure("LazyPaginator", lazy, records, args.rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,111 @@
+"""Measures lookup latency of the SQLite-backed response cache
+
+Fills a fresh database with responses, then times lookups the way a
+command would do them, through ``getOrFetch``:
+
+    python Benchmarks/persistent_cache.py --entries 100000 --lookups 5000
+
+``memory`` looks up keys that are still in the in-memory tier, ``store``
+looks them up in a cache that was just opened on the same database, as
+after a restart, and ``miss`` looks up keys that were never stored.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from cogs import percentile
+from multidict import CIMultiDict
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.cache import makeKey  # noqa: E402
+from Libs.http import Response  # noqa: E402
+from Libs.persistentcache import PersistentResponseCache, SQLiteStore  # noqa: E402
+
+TTL = 3600
+
+
+def keyFor(index: int) -> str:
+    return makeKey("GET", f"https://api.github.com/repos/someone/repo-{index}")
+
+
+async def fill(cache: PersistentResponseCache, entries: int, bodySize: int) -> float:
+    start = time.perf_counter()
+    for index in range(entries):
+        headers = CIMultiDict({"ETag": f'"{index:x}"'})
+        await cache.set(
+            keyFor(index), Response(200, headers, os.urandom(bodySize)), TTL
+        )
+    await cache.flush()
+    return time.perf_counter() - start
+
+
+async def timeLookups(cache: PersistentResponseCache, keys: List[str]) -> List[float]:
+    async def fetch() -> Response:
+        return Response(200, CIMultiDict(), b"{}")
+
+    latencies = []
+    for key in keys:
+        start = time.perf_counter()
+        await cache.getOrFetch(key, fetch, TTL)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("responses.sqlite3")
+        cache = PersistentResponseCache(SQLiteStore(path))
+        elapsed = await fill(cache, args.entries, args.body_size)
+        print(
+            f"Stored {args.entries} responses of {args.body_size} bytes in "
+            f"{elapsed:.1f}s ({args.entries / elapsed:.0f}/s), "
+            f"{path.stat().st_size / 1024 / 1024:.1f}MB on disk"
+        )
+
+        # The most recently stored keys are the ones still held in memory
+        inMemory = list(cache._entries)
+        results = {
+            "memory": await timeLookups(
+                cache, random.choices(inMemory, k=args.lookups)
+            ),
+        }
+        await cache.close()
+
+        cache = PersistentResponseCache(SQLiteStore(path))
+        stored = random.sample(range(args.entries), args.lookups)
+        results["store"] = await timeLookups(cache, [keyFor(i) for i in stored])
+        missing = range(args.entries, args.entries + args.lookups)
+        results["miss"] = await timeLookups(cache, [keyFor(i) for i in missing])
+        print(f"{args.lookups} lookups each, {cache.stats()}")
+        await cache.close()
+
+    for name, latencies in results.items():
+        result = summarize(latencies)
+        print(
+            f"{name:<8} p50 {result['p50_us']:>8.1f}us  "
+            f"p99 {result['p99_us']:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--body-size", type=int, default=1024)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,158 @@
+"""An in-process stand-in for a Redis server, for running Rin's shared cache locally
+
+``RESPServer`` speaks enough of the Redis protocol for ``RESPStore``: GET,
+SET with an expiry, DEL, EXISTS, SCAN, DBSIZE, FLUSHDB, PING, AUTH and
+SELECT. Everything lives in one dict, and expired keys are dropped when
+they're next looked at. Pipelined commands are answered in order, just as
+Redis does.
+
+This isn't meant to be run on its own.
+"""
+
+import asyncio
+import fnmatch
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.resp import RESPError, readReply  # noqa: E402
+
+
+def encodeReply(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, RESPError):
+        return b"-%s\r\n" % str(value).encode()
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(encodeReply(item) for item in value)
+
+
+class RESPServer:
+    """Serves the Redis protocol from memory on a local port
+
+    ``commands`` counts every command answered, and ``password``, if set,
+    has to be sent with AUTH before anything else.
+    """
+
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.port: Optional[int] = None
+        self.commands = 0
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._handlers: Dict[bytes, Callable[[List[bytes]], Any]] = {
+            b"PING": lambda args: "PONG",
+            b"SELECT": lambda args: "OK",
+            b"GET": self._get,
+            b"SET": self._set,
+            b"DEL": self._delete,
+            b"EXISTS": lambda args: sum(self._lookup(key) is not None for key in args),
+            b"SCAN": self._scan,
+            b"DBSIZE": lambda args: len(self._live()),
+            b"FLUSHDB": self._flush,
+        }
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._serve, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}127.0.0.1:{self.port}"
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        authenticated = self.password is None
+        try:
+            while True:
+                try:
+                    command = await readReply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                self.commands += 1
+                name, args = command[0].upper(), command[1:]
+                if name == b"AUTH":
+                    authenticated = args[-1].decode() == self.password
+                    reply = "OK" if authenticated else RESPError("WRONGPASS")
+                elif not authenticated:
+                    reply = RESPError("NOAUTH Authentication required.")
+                elif name in self._handlers:
+                    reply = self._handlers[name](args)
+                else:
+                    reply = RESPError(f"ERR unknown command '{name.decode()}'")
+                writer.write(encodeReply(reply))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def _lookup(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expiresAt = item
+        if expiresAt is not None and time.time() >= expiresAt:
+            del self.data[key]
+            return None
+        return value
+
+    def _live(self) -> List[bytes]:
+        return [key for key in list(self.data) if self._lookup(key) is not None]
+
+    def _get(self, args: List[bytes]) -> Optional[bytes]:
+        return self._lookup(args[0])
+
+    def _set(self, args: List[bytes]) -> Any:
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        expiresAt = None
+        for option, amount in zip(options, args[3:]):
+            if option == b"EX":
+                expiresAt = time.time() + int(amount)
+            elif option == b"PX":
+                expiresAt = time.time() + int(amount) / 1000
+            elif option == b"EXAT":
+                expiresAt = int(amount)
+            elif option == b"PXAT":
+                expiresAt = int(amount) / 1000
+        self.data[key] = (value, expiresAt)
+        return "OK"
+
+    def _delete(self, args: List[bytes]) -> int:
+        deleted = sum(self._lookup(key) is not None for key in args)
+        for key in args:
+            self.data.pop(key, None)
+        return deleted
+
+    def _scan(self, args: List[bytes]) -> List[Any]:
+        cursor = int(args[0])
+        options = {args[i].upper(): args[i + 1] for i in range(1, len(args) - 1, 2)}
+        count = int(options.get(b"COUNT", 10))
+        keys = sorted(self._live())
+        batch = keys[cursor : cursor + count]
+        nextCursor = cursor + count if cursor + count < len(keys) else 0
+        if b"MATCH" in options:
+            pattern = options[b"MATCH"].decode()
+            batch = [
+                key
+                for key in batch
+                if fnmatch.fnmatchcase(key.decode(errors="replace"), pattern)
+            ]
+        return [str(nextCursor).encode(), batch]
+
+    def _flush(self, args: List[bytes]) -> str:
+        self.data.clear()
+        return "OK"
@@ -0,0 +1,139 @@
+"""Compares upstream load from several Rin shards with and without a shared cache
+
+Each shard is its own process, running the MangaDex, Jikan and GitHub
+commands through RinCore against the stub upstreams in Benchmarks/stub.py,
+one shard after the other. With ``--mode shared`` every shard points
+Response_Cache_URL at the in-process Redis stand-in in
+Benchmarks/respserver.py, so later shards find what earlier ones fetched:
+
+    python Benchmarks/shared_cache.py --shards 4 --rounds 3
+
+The store's own lookup throughput is measured afterwards, one lookup at a
+time and with ``--concurrency`` lookups pipelined over the connection pool.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from multidict import CIMultiDict
+from respserver import RESPServer
+from stub import StubServer, createBot, invoke, releaseViews
+
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
+
+from Libs.cache import makeKey  # noqa: E402
+from Libs.http import Response  # noqa: E402
+from Libs.persistentcache import PersistentResponseCache, RESPStore  # noqa: E402
+from Libs.resp import RESPClient  # noqa: E402
+
+CASES: List[Tuple[str, Dict[str, Any]]] = [
+    ("mangadex search manga", {"name": "rin"}),
+    ("mal search anime", {"anime_name": "rin"}),
+    ("mal search manga", {"manga_name": "rin"}),
+    ("mal seasons upcoming", {}),
+    ("github repo", {"owner": "someone", "repo": "Rin"}),
+    ("github issues all", {"owner": "someone", "repo": "Rin", "state": "Open"}),
+    ("github releases list", {"owner": "someone", "repo": "Rin"}),
+]
+
+
+async def runShard(url: Optional[str], rounds: int) -> Dict[str, float]:
+    if url is not None:
+        os.environ["Response_Cache_URL"] = url
+    server = StubServer()
+    await server.start()
+    bot = await createBot(server)
+    latencies: List[float] = []
+    try:
+        for _ in range(rounds):
+            for name, options in CASES:
+                start = time.perf_counter()
+                interaction, error = await invoke(bot, name, options)
+                latencies.append(time.perf_counter() - start)
+                server.popResponses(interaction.token)
+                if error is not None:
+                    raise RuntimeError(f"{name} failed: {error!r}") from error
+        releaseViews(bot)
+        return {
+            "upstream": server.upstreamRequests,
+            "store_hits": bot.cache.stats().get("store_hits", 0),
+            "p50_ms": statistics.median(latencies) * 1000,
+        }
+    finally:
+        await bot.close()
+        await server.close()
+
+
+def shardProcess(url: Optional[str], rounds: int) -> Dict[str, float]:
+    return asyncio.run(runShard(url, rounds))
+
+
+async def timeStore(url: str, lookups: int, concurrency: int) -> float:
+    """Lookups per second through a RESPStore, with ``concurrency`` in flight at once"""
+    store = RESPStore(RESPClient.fromURL(url))
+    cache = PersistentResponseCache(store)
+    key = makeKey("GET", "https://api.mangadex.org/manga", {"title": "rin"})
+    await cache.set(key, Response(200, CIMultiDict(), b"x" * 4096), 600)
+    await cache.flush()
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            await store.get(key)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(lookups // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await cache.close()
+    return lookups / elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = RESPServer()
+    await server.start()
+    loop = asyncio.get_running_loop()
+    print(f"{args.shards} shards, {len(CASES)} commands x {args.rounds} rounds each")
+    try:
+        for mode in args.modes:
+            server.data.clear()
+            url = server.url if mode == "shared" else None
+            results = []
+            for _ in range(args.shards):
+                # A fresh process per shard, as in a real deployment
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    results.append(
+                        await loop.run_in_executor(
+                            executor, shardProcess, url, args.rounds
+                        )
+                    )
+            print(
+                f"{mode:<7} upstream requests per shard "
+                f"{[int(result['upstream']) for result in results]}, "
+                f"total {sum(int(result['upstream']) for result in results)}  |  "
+                f"store hits {[int(result['store_hits']) for result in results]}  |  "
+                f"command p50 {[round(result['p50_ms'], 2) for result in results]}ms"
+            )
+
+        for concurrency in (1, args.concurrency):
+            throughput = await timeStore(server.url, args.lookups, concurrency)
+            print(f"store lookups, {concurrency:>3} in flight: {throughput:>8.0f}/s")
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument(
+        "--modes", nargs="+", choices=["memory", "shared"], default=["memory", "shared"]
+    )
+    asyncio.run(main(parser.parse_args()))
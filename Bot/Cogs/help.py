@@ -13,16 +13,16 @@ class HelpSelect(discord.ui.Select):
             options=[
                 discord.SelectOption(
                     label=cog_name,
-                    description=cog.__doc__,
+                    description=description,
                 )
-                for cog_name, cog in cog.bot.cogs.items()
+                for cog_name, description in cog.bot.cogDescriptions().items()
                 if cog_name not in ["InteractionFailureHandler", "IPCServer"]
             ],
         )
         self.cog = cog
 
     async def callback(self, interaction: discord.Interaction):
-        cog = self.cog.bot.get_cog(self.values[0])
+        cog = self.cog.bot.cogLoader.loadCog(self.values[0])
         embed = discord.Embed(
             title=f"{cog.__cog_name__} Commands",
             description="\n".join(
@@ -62,7 +62,7 @@ class Help(commands.Cog):
                 len(
                     [
                         cogs
-                        for cogs in self.bot.cogs
+                        for cogs in self.bot.cogDescriptions()
                         if cogs not in ["InteractionFailureHandler"]
                     ]
                 )
@@ -2,6 +2,7 @@ import traceback
 
 import discord
 from discord.ext import commands
+from Libs.ratelimit import RateLimitedError
 
 
 class InteractionFailureHandler(commands.Cog):
@@ -53,6 +54,14 @@ class InteractionFailureHandler(commands.Cog):
                     description=f"Kumiko is missing the following permissions: {missingPerms}"
                 )
             )
+        elif isinstance(error, discord.ApplicationCommandInvokeError) and isinstance(
+            error.original, RateLimitedError
+        ):
+            await ctx.respond(
+                embed=discord.Embed(
+                    description=f"{error.original.host} is getting a lot of requests right now. Try again in {max(int(error.original.retryAfter), 1)} second(s)."
+                )
+            )
         elif isinstance(error, discord.ApplicationCommandInvokeError):
             errorEmbed = discord.Embed(
                 title="An error has occured",
@@ -49,6 +49,26 @@ class Rin(commands.Cog):
             name="Python Version", value=platform.python_version(), inline=True
         )
         embed.add_field(name="Pycord Version", value=discord.__version__, inline=True)
+        cacheStats = self.bot.cache.stats()
+        cacheHits = cacheStats["hits"] + cacheStats["stale_hits"]
+        hitRate = cacheHits / max(cacheHits + cacheStats["misses"], 1) * 100
+        embed.add_field(
+            name="API Cache",
+            value=f"{hitRate:.1f}% hit rate ({cacheStats['entries']} entries)",
+            inline=True,
+        )
+        limiterStats = self.bot.rateLimiter.stats().values()
+        embed.add_field(
+            name="Rate Limits",
+            value=f"{sum(host['queued'] for host in limiterStats)} queued, {sum(host['rejected'] for host in limiterStats)} turned away",
+            inline=True,
+        )
+        loopStats = self.bot.loopMonitor.stats()
+        embed.add_field(
+            name="Event Loop",
+            value=f"{loopStats['lag_p99_ms']:.1f}ms p99 lag, {loopStats['slow_callbacks']} slow callbacks",
+            inline=True,
+        )
         embed.set_thumbnail(url=self.bot.user.display_avatar)
         await ctx.respond(embed=embed)
 
@@ -0,0 +1,166 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import discord
+from Libs.tracing import span, tracing
+
+# Discord drops interactions that aren't answered within 3 seconds. Commands
+# that are predicted to take longer than this are deferred up front, which
+# leaves room for the prediction to be off
+DEFER_THRESHOLD = 1.5
+
+# Smoothing for the running mean and deviation, as in TCP's RTO estimator.
+# Predictions are the mean plus a few deviations, so a command that is only
+# sometimes slow still gets deferred
+EWMA_ALPHA = 0.25
+DEVIATION_WEIGHT = 2
+
+
+def expectedLatency(seconds: float) -> Callable:
+    """Seeds the latency prediction of a command that hasn't been run yet
+
+    Meant for commands that are known to chain several upstream requests, so
+    they are deferred from their very first run. Apply it below the command
+    decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.__rin_expected_latency__ = seconds
+        return func
+
+    return decorator
+
+
+def commandPath(ctx: discord.ApplicationContext) -> Tuple[str, List[str]]:
+    """Returns the qualified name of the command being run, and the subcommand names in it"""
+    names = []
+    options = (ctx.interaction.data or {}).get("options", [])
+    while options and options[0].get("type") in (
+        discord.SlashCommandOptionType.sub_command.value,
+        discord.SlashCommandOptionType.sub_command_group.value,
+    ):
+        names.append(options[0]["name"])
+        options = options[0].get("options", [])
+    return " ".join([ctx.command.name, *names]), names
+
+
+def resolveCommand(command: Any, names: List[str]) -> Any:
+    for name in names:
+        command = next(
+            (sub for sub in getattr(command, "subcommands", []) if sub.name == name),
+            None,
+        )
+        if command is None:
+            return None
+    return command
+
+
+class CommandLatency:
+    """Running estimate of how long one command takes"""
+
+    __slots__ = ("mean", "deviation", "samples", "deferred", "direct")
+
+    def __init__(self, seed: float):
+        self.mean = seed
+        self.deviation = seed / 2
+        self.samples = 0
+        self.deferred = 0
+        self.direct = 0
+
+    @property
+    def predicted(self) -> float:
+        return self.mean + DEVIATION_WEIGHT * self.deviation
+
+    def observe(self, seconds: float) -> None:
+        if self.samples == 0:
+            # A seed is only a guess, so the first real run replaces it
+            self.mean = seconds
+            self.deviation = seconds / 2
+        else:
+            self.deviation += EWMA_ALPHA * (abs(seconds - self.mean) - self.deviation)
+            self.mean += EWMA_ALPHA * (seconds - self.mean)
+        self.samples += 1
+
+
+class LatencyPredictor:
+    """Decides which commands to defer based on how long they've taken before
+
+    Commands without any history or ``expectedLatency`` seed are answered
+    directly, which saves the extra round trip a deferral costs.
+    """
+
+    def __init__(self, threshold: float = DEFER_THRESHOLD):
+        self.threshold = threshold
+        self.commands: Dict[str, CommandLatency] = {}
+
+    def shouldDefer(self, name: str, command: Any = None) -> bool:
+        latency = self.commands.get(name)
+        if latency is None:
+            seed = getattr(
+                getattr(command, "callback", None), "__rin_expected_latency__", None
+            )
+            if seed is None:
+                return False
+            latency = self.commands[name] = CommandLatency(seed)
+        if latency.predicted > self.threshold:
+            latency.deferred += 1
+            return True
+        latency.direct += 1
+        return False
+
+    def observe(self, name: str, seconds: float) -> None:
+        latency = self.commands.get(name)
+        if latency is None:
+            latency = self.commands[name] = CommandLatency(seconds)
+        latency.observe(seconds)
+
+    def predict(self, name: str) -> Optional[float]:
+        latency = self.commands.get(name)
+        return latency.predicted if latency is not None else None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "predicted_ms": latency.predicted * 1000,
+                "deferred": latency.deferred,
+                "direct": latency.direct,
+            }
+            for name, latency in self.commands.items()
+        }
+
+
+class RinContext(discord.ApplicationContext):
+    """Application context whose ``defer`` does nothing once the interaction has been answered
+
+    Lets commands that defer themselves keep doing so after RinCore has
+    already deferred them automatically. Responses are also timed as the
+    respond stage of the command's trace.
+    """
+
+    @property
+    def defer(self) -> Callable:
+        if self.interaction.response.is_done():
+            return self._alreadyDeferred
+        return self.interaction.response.defer
+
+    async def _alreadyDeferred(self, *args, **kwargs) -> None:
+        return None
+
+    @property
+    def respond(self) -> Callable:
+        if not tracing():
+            return self.interaction.respond
+        return self._traced("respond", self.interaction.respond)
+
+    @property
+    def send_followup(self) -> Callable:
+        send = super().send_followup
+        if not tracing():
+            return send
+        return self._traced("respond", send)
+
+    def _traced(self, name: str, send: Callable) -> Callable:
+        async def tracedSend(*args, **kwargs):
+            with span(name, followup=self.interaction.response.is_done()):
+                return await send(*args, **kwargs)
+
+        return tracedSend
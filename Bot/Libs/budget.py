@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import aiohttp
+
+# What a call to an upstream gets unless its client says otherwise
+DEFAULT_BUDGET = 10
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2, sock_read=4)
+
+T = TypeVar("T")
+
+
+def isTransient(error: BaseException) -> bool:
+    """Whether an error is worth another attempt: a connection error or a timeout"""
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+class CallBudget:
+    """Spends a latency budget across every attempt at a call to an upstream
+
+    Each attempt is given ``timeout``, cut short to whatever is left of
+    ``budget``. Attempts that fail with an error ``retryError`` accepts, or
+    that return something ``retryResult`` rejects, are retried up to
+    ``retries`` times with exponential ``backoff``, as long as the next try
+    would still start within the budget.
+    """
+
+    def __init__(
+        self,
+        budget: float = DEFAULT_BUDGET,
+        timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+        retries: int = 2,
+        backoff: float = 0.25,
+    ):
+        self.budget = budget
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.retried = 0
+        self.failures = 0
+
+    def timeoutWithin(self, deadline: float) -> aiohttp.ClientTimeout:
+        remaining = max(deadline - time.monotonic(), 0.1)
+        return aiohttp.ClientTimeout(
+            total=min(self.timeout.total, remaining),
+            connect=self.timeout.connect,
+            sock_read=self.timeout.sock_read,
+        )
+
+    def canRetry(self, attempt: int, deadline: float) -> bool:
+        nextTry = time.monotonic() + self.backoff * 2**attempt
+        return attempt < self.retries and nextTry < deadline
+
+    async def run(
+        self,
+        send: Callable[[aiohttp.ClientTimeout], Awaitable[T]],
+        retryResult: Callable[[T], bool] = lambda result: False,
+        retryError: Callable[[BaseException], bool] = isTransient,
+    ) -> T:
+        """Calls ``send`` with the timeout for each attempt until one succeeds or the budget runs out
+
+        The last result is returned, or the last error raised, once there's
+        no retrying left.
+        """
+        deadline = time.monotonic() + self.budget
+        attempt = 0
+        while True:
+            try:
+                result = await send(self.timeoutWithin(deadline))
+            except Exception as e:
+                if not retryError(e):
+                    raise
+                if not self.canRetry(attempt, deadline):
+                    self.failures += 1
+                    raise
+            else:
+                if not retryResult(result):
+                    return result
+                if not self.canRetry(attempt, deadline):
+                    self.failures += 1
+                    return result
+            await asyncio.sleep(self.backoff * 2**attempt)
+            attempt += 1
+            self.retried += 1
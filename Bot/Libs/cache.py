@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import urlsplit
+
+import orjson
+
+# How long (in seconds) a response from each upstream is served before it is
+# considered stale. Hosts that only serve random results are never cached
+SERVICE_TTLS = {
+    "api.github.com": 120,
+    "api.jikan.moe": 600,
+    "api.mangadex.org": 300,
+    "api.modrinth.com": 300,
+    "www.thebluealliance.com": 60,
+    "tenor.googleapis.com": 600,
+    "www.googleapis.com": 900,
+    "api.spiget.org": 900,
+    "api.mcsrvstat.us": 60,
+    "jisho.org": 3600,
+    "api.twitter.com": 120,
+    "api.adviceslip.com": 0,
+    "api.waifu.im": 0,
+    "api.waifu.pics": 0,
+    "meme-api.herokuapp.com": 0,
+}
+DEFAULT_TTL = 60
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# How long a response that carries validators (an ETag or Last-Modified) is
+# kept once it's too stale to serve, so it can be revalidated with a
+# conditional request instead of being fetched again in full
+DEFAULT_REVALIDATE_WINDOW = 24 * 60 * 60
+
+# Headers that change what an upstream returns for the same URL
+AUTH_HEADERS = ("authorization", "x-tba-auth-key")
+
+
+def makeKey(
+    method: str,
+    url: str,
+    params: Optional[Dict] = None,
+    authScope: str = "",
+) -> str:
+    """Builds a fixed-length cache key from the request that produced a response
+
+    Parameters are sorted so that argument order doesn't matter, and the whole
+    key is hashed so that no credentials are ever kept in plain text.
+    """
+    normalized = orjson.dumps(
+        [method.upper(), url, params or {}, authScope],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(normalized, digest_size=20).hexdigest()
+
+
+def authScopeOf(headers: Optional[Dict]) -> str:
+    """Returns an opaque scope for the credentials in the given headers"""
+    if not headers:
+        return ""
+    scope = [
+        f"{k.lower()}={v}" for k, v in headers.items() if k.lower() in AUTH_HEADERS
+    ]
+    if not scope:
+        return ""
+    return hashlib.blake2b(
+        "\n".join(sorted(scope)).encode(), digest_size=12
+    ).hexdigest()
+
+
+class CacheEntry:
+    """A cached value along with its freshness deadlines"""
+
+    __slots__ = ("value", "size", "expiresAt", "staleUntil", "keepUntil")
+
+    def __init__(
+        self,
+        value: Any,
+        size: int,
+        expiresAt: float,
+        staleUntil: float,
+        keepUntil: Optional[float] = None,
+    ):
+        self.value = value
+        self.size = size
+        self.expiresAt = expiresAt
+        self.staleUntil = staleUntil
+        self.keepUntil = staleUntil if keepUntil is None else keepUntil
+
+
+class ResponseCache:
+    """Bounded in-memory cache for upstream responses
+
+    Entries are evicted least recently used first once the cache holds more
+    than ``maxBytes`` of response bodies. Once an entry's TTL passes, it is
+    still served for ``staleFactor`` times its TTL while a single background
+    request refreshes it (stale-while-revalidate). Values with
+    ``validators`` are then kept for another ``revalidateWindow`` seconds,
+    for callers that can revalidate them with a conditional request.
+
+    Cached values must expose ``size`` (in bytes) and ``cacheable``.
+    """
+
+    def __init__(
+        self,
+        maxBytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Dict[str, int]] = None,
+        defaultTTL: int = DEFAULT_TTL,
+        staleFactor: float = 1.0,
+        revalidateWindow: int = DEFAULT_REVALIDATE_WINDOW,
+    ):
+        self.maxBytes = maxBytes
+        self.ttls = SERVICE_TTLS if ttls is None else ttls
+        self.defaultTTL = defaultTTL
+        self.staleFactor = staleFactor
+        self.revalidateWindow = revalidateWindow
+        self.currentBytes = 0
+        self.hits = 0
+        self.staleHits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self.logger = logging.getLogger("rinbot")
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttlFor(self, url: str) -> int:
+        """Returns the configured TTL for the host the URL points to"""
+        return self.ttls.get(urlsplit(url).hostname, self.defaultTTL)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.staleHits,
+            "revalidations": self.revalidations,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.currentBytes,
+        }
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry for the key if it is still servable or can be revalidated, marking it as recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.keepUntil:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        if ttl <= 0 or not value.cacheable or value.size > self.maxBytes:
+            return
+        now = time.monotonic()
+        staleUntil = now + ttl * (1 + self.staleFactor)
+        keepUntil = staleUntil
+        if getattr(value, "validators", None):
+            keepUntil += self.revalidateWindow
+        self._insert(
+            key, CacheEntry(value, value.size, now + ttl, staleUntil, keepUntil)
+        )
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self.currentBytes += entry.size
+        while self.currentBytes > self.maxBytes:
+            oldestKey = next(iter(self._entries))
+            self._remove(oldestKey)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        """Drops every entry, leaving the hit and miss counters alone"""
+        self._entries.clear()
+        self.currentBytes = 0
+
+    async def close(self) -> None:
+        """Releases whatever the cache holds outside of memory. Nothing, for this one"""
+
+    async def getOrFetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: int,
+        revalidate: Optional[Callable[[Any], Awaitable[Any]]] = None,
+    ) -> Any:
+        """Serves the key from the cache, calling ``fetch`` to fill or refresh it
+
+        ``revalidate`` is given the cached value and returns a fresh one,
+        usually through a conditional request. When set, it's used instead
+        of ``fetch`` for the background refresh of a stale value, and for
+        values that are too stale to serve but still have validators.
+        """
+        if ttl <= 0:
+            return await fetch()
+        entry = await self.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expiresAt:
+                self.hits += 1
+                return entry.value
+            if now < entry.staleUntil:
+                self.staleHits += 1
+                previous = entry.value
+                self._refresh(
+                    key,
+                    fetch if revalidate is None else lambda: revalidate(previous),
+                    ttl,
+                )
+                return entry.value
+            if revalidate is not None and getattr(entry.value, "validators", None):
+                self.revalidations += 1
+                value = await revalidate(entry.value)
+                await self.set(key, value, ttl)
+                return value
+        self.misses += 1
+        value = await fetch()
+        await self.set(key, value, ttl)
+        return value
+
+    def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def revalidate():
+            try:
+                await self.set(key, await fetch(), ttl)
+            except Exception as e:
+                self.logger.debug(f"Failed to refresh cached response: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(revalidate())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.currentBytes -= entry.size
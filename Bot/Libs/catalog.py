@@ -0,0 +1,143 @@
+import inspect
+from typing import Any, Dict, Iterator, List, Optional
+
+import discord
+import orjson
+from discord.commands import SlashCommandGroup
+from Libs.lazycogs import LazyCommand
+
+# Discord's option types for subcommands and subcommand groups
+SUB_COMMAND = 1
+SUB_COMMAND_GROUP = 2
+
+
+def moduleName(module: Optional[str]) -> str:
+    """How the dashboard expects a command's module. Groups are made in py-cord's own module"""
+    if module == "discord.commands.core":
+        return "None"
+    return module.replace("Cogs.", "")
+
+
+def walkCommand(command: discord.ApplicationCommand) -> Iterator[Dict[str, str]]:
+    """Describes a command and everything under it, in the order ``walk_application_commands`` uses"""
+    if isinstance(command, SlashCommandGroup):
+        for subcommand in command.subcommands:
+            yield from walkCommand(subcommand)
+    yield {
+        "name": command.qualified_name,
+        "description": command.description,
+        "module": moduleName(command.module),
+        "parent_name": command.parent.name if command.parent is not None else "None",
+    }
+
+
+def walkPayload(
+    payload: Dict[str, Any], extension: str, parents: List[str]
+) -> Iterator[Dict[str, str]]:
+    """Describes a deferred command from its sync payload, as ``walkCommand`` would the real one"""
+    path = [*parents, payload["name"]]
+    subcommands = [
+        option
+        for option in payload.get("options", [])
+        if option.get("type") in (SUB_COMMAND, SUB_COMMAND_GROUP)
+    ]
+    for option in subcommands:
+        yield from walkPayload(option, extension, path)
+    isGroup = subcommands or (parents and payload.get("type") == SUB_COMMAND_GROUP)
+    yield {
+        "name": " ".join(path),
+        "description": payload["description"],
+        "module": "None" if isGroup else moduleName(extension),
+        "parent_name": parents[-1] if parents else "None",
+    }
+
+
+class CommandCatalog:
+    """Rin's commands and cogs, serialized once for the IPC routes
+
+    The catalog is built the first time it's asked for, and rebuilt only
+    after a cog has been added or removed, which bumps its version. Every
+    command and cog is kept as its own JSON document, so routes for a
+    single one are a dict lookup. Commands from deferred cogs are described
+    from the cog manifest, without importing them.
+    """
+
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+        self.version = 0
+        self._built = -1
+        self._commands: Dict[str, bytes] = {}
+        self._cogs: Dict[str, bytes] = {}
+        self._allCommands = b""
+        self._allCogs = b""
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    def _build(self) -> None:
+        if self._built == self.version:
+            return
+        entries = []
+        for command in self.bot.pending_application_commands:
+            if isinstance(command, LazyCommand):
+                entries.extend(walkPayload(command.payload, command.extension, []))
+            else:
+                entries.extend(walkCommand(command))
+        self._commands = {entry["name"]: orjson.dumps(entry) for entry in entries}
+        self._allCommands = orjson.dumps(
+            {"version": self.version, "count": len(entries), "data": entries}
+        )
+
+        descriptions = self.bot.cogDescriptions()
+        self._cogs = {
+            name: orjson.dumps(
+                {"name": name, "description": inspect.cleandoc(description or "")}
+            )
+            for name, description in descriptions.items()
+        }
+        cogs = [
+            {"name": name, "description": description}
+            for name, description in descriptions.items()
+            if name not in ["InteractionFailureHandler", "IPCServer"]
+        ]
+        self._allCogs = orjson.dumps(
+            {"version": self.version, "count": len(cogs), "cogs": cogs}
+        )
+        self._built = self.version
+
+    def allCommands(self) -> bytes:
+        self._build()
+        return self._allCommands
+
+    def command(self, name: str) -> bytes:
+        """Raises ``KeyError`` for an unknown command"""
+        self._build()
+        try:
+            return self._commands[name]
+        except KeyError:
+            raise KeyError(f"No command named {name}") from None
+
+    def commands(self, names: List[str]) -> bytes:
+        """Several commands in one document, along with the names that weren't found"""
+        self._build()
+        found = [self._commands[name] for name in names if name in self._commands]
+        return orjson.dumps(
+            {
+                "version": self.version,
+                "count": len(found),
+                "data": [orjson.Fragment(command) for command in found],
+                "missing": [name for name in names if name not in self._commands],
+            }
+        )
+
+    def allCogs(self) -> bytes:
+        self._build()
+        return self._allCogs
+
+    def cog(self, name: str) -> bytes:
+        """Raises ``KeyError`` for an unknown cog"""
+        self._build()
+        try:
+            return self._cogs[name]
+        except KeyError:
+            raise KeyError(f"No cog named {name}") from None
@@ -0,0 +1,207 @@
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+from gql import Client
+from gql.client import AsyncClientSession
+from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+from graphql import DocumentNode
+from Libs.budget import CallBudget, isTransient
+from Libs.hedging import Hedger
+from Libs.metrics import (
+    UPSTREAM_BYTES,
+    UPSTREAM_ERRORS,
+    UPSTREAM_LATENCY,
+    UPSTREAM_RESPONSES,
+)
+from Libs.ratelimit import RateLimiter
+from Libs.tracing import span
+
+
+class PreparedClient(Client):
+    """gql Client that validates each query document against the schema only once
+
+    Rin's queries are module-level constants, so there's no need to walk
+    the same document against the schema on every single execution.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._validated: Dict[int, DocumentNode] = {}
+
+    def validate(self, document: DocumentNode):
+        if id(document) not in self._validated:
+            super().validate(document)
+            self._validated[id(document)] = document
+
+
+class QueryResult:
+    """The data a query returned, in the shape ResponseCache expects of its values
+
+    Results where any top level field came back null (usually because what
+    was asked for doesn't exist) aren't cached.
+    """
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self.size = len(orjson.dumps(data))
+
+    @property
+    def cacheable(self) -> bool:
+        return all(value is not None for value in self.data.values())
+
+
+def connectionError(error: BaseException) -> Optional[BaseException]:
+    """The connection error or timeout a query failed with, if that's why it failed
+
+    Newer versions of gql wrap these in their own exceptions.
+    """
+    for candidate in (error, error.__cause__):
+        if candidate is not None and isTransient(candidate):
+            return candidate
+    return None
+
+
+def isRetryable(error: BaseException) -> bool:
+    """Whether a failed query is worth another attempt, as a failed GET would be"""
+    if isinstance(error, TransportServerError):
+        return error.code is None or error.code >= 500 or error.code == 429
+    return connectionError(error) is not None
+
+
+class GraphQLClient:
+    """A persistent connection to a GraphQL API
+
+    The transport is connected and the schema is introspected once, on first
+    use, after which every query only takes a single round trip. Requests go
+    through the connector returned by ``getConnector`` (normally RinCore's
+    shared pool), which this client never closes, and are paced by
+    ``limiter`` if one is given. APIs whose schema is too large to be worth
+    introspecting can set ``fetchSchema`` to False, which skips validating
+    queries locally.
+
+    Queries are spent against ``budget`` and retried the same way
+    ServiceClient GETs are, and hedged through ``hedger`` if one is given,
+    as they only ever read.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        getConnector: Callable[[], aiohttp.BaseConnector],
+        headers: Optional[Dict[str, str]] = None,
+        limiter: Optional[RateLimiter] = None,
+        fetchSchema: bool = True,
+        budget: Optional[CallBudget] = None,
+        hedger: Optional[Hedger] = None,
+    ):
+        self.url = url
+        self.getConnector = getConnector
+        self.headers = headers
+        self.limiter = limiter
+        self.fetchSchema = fetchSchema
+        self.budget = budget or CallBudget()
+        self.hedger = hedger
+        self.client: Optional[PreparedClient] = None
+        self.session: Optional[AsyncClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> AsyncClientSession:
+        """Connects and fetches the schema if that hasn't been done yet"""
+        async with self._lock:
+            if self.session is None:
+                transport = AIOHTTPTransport(
+                    url=self.url,
+                    headers=self.headers,
+                    timeout=self.budget.timeout.total,
+                    client_session_args={
+                        "connector": self.getConnector(),
+                        "connector_owner": False,
+                        # Keeps the connect and read bounds, which the
+                        # transport's own timeout leaves out
+                        "timeout": self.budget.timeout,
+                    },
+                )
+                client = PreparedClient(
+                    transport=transport,
+                    fetch_schema_from_transport=self.fetchSchema,
+                    execute_timeout=self.budget.budget,
+                )
+                self.session = await client.connect_async()
+                self.client = client
+        return self.session
+
+    async def execute(self, document: DocumentNode, params: Dict) -> Dict:
+        session = self.session or await self.connect()
+        host = urlsplit(self.url).hostname or ""
+
+        async def attempt(timeout: aiohttp.ClientTimeout) -> Dict:
+            if self.limiter is not None:
+                with span("ratelimit", host=host):
+                    await self.limiter.acquire(self.url)
+            start = time.perf_counter()
+            # gql parses the response itself, so the parse is part of this span
+            with span("fetch", host=host, method="POST") as stage:
+                try:
+                    result = await session.execute(
+                        document,
+                        variable_values=params,
+                        extra_args={"timeout": timeout},
+                    )
+                except TransportQueryError:
+                    # GraphQL errors still come back with a 200
+                    self._observe(host, 200, start)
+                    raise
+                except TransportServerError as e:
+                    if e.code is None:
+                        UPSTREAM_ERRORS.labels(host, type(e).__name__).inc()
+                        raise
+                    if self.limiter is not None:
+                        self.limiter.update(self.url, e.code, {})
+                    self._observe(host, e.code, start)
+                    raise
+                except Exception as e:
+                    error = connectionError(e)
+                    if error is not None:
+                        UPSTREAM_ERRORS.labels(host, type(error).__name__).inc()
+                    raise
+                # gql doesn't hand back the body, so this counts the data in it
+                size = len(orjson.dumps(result))
+                stage.set(status=200, bytes=size)
+            elapsed = self._observe(host, 200, start)
+            UPSTREAM_BYTES.labels(host).inc(size)
+            if self.hedger is not None:
+                self.hedger.observe(self.url, elapsed)
+            return result
+
+        if self.hedger is None:
+            return await self.budget.run(attempt, retryError=isRetryable)
+        return await self.budget.run(
+            lambda timeout: self.hedger.run(self.url, lambda: attempt(timeout)),
+            retryError=isRetryable,
+        )
+
+    def _observe(self, host: str, status: int, start: float) -> float:
+        """Records a query that got a response, the way HTTPClient records requests"""
+        elapsed = time.perf_counter() - start
+        UPSTREAM_LATENCY.labels(host).observe(elapsed)
+        UPSTREAM_RESPONSES.labels(host, status).inc()
+        return elapsed
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self.client is not None:
+                # gql leaves the aiohttp session open when it doesn't own the
+                # connector, but closing it here leaves the shared pool alone
+                transportSession = self.client.transport.session
+                await self.client.close_async()
+                if transportSession is not None:
+                    await transportSession.close()
+            self.client = None
+            self.session = None
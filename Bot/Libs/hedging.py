@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+# How many recent response times are kept per host, and how many are needed
+# before the p95 is trusted enough to hedge on
+WINDOW_SIZE = 200
+MIN_SAMPLES = 20
+HEDGE_PERCENTILE = 0.95
+
+# Never hedge sooner than this, no matter how fast a host usually is
+MIN_HEDGE_DELAY = 0.05
+
+
+class LatencyWindow:
+    """The most recent response times of a single host"""
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.hedged = 0
+        self.primaryWins = 0
+        self.hedgeWins = 0
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Returns the q-th percentile, or None if there aren't enough samples yet"""
+        if len(self.samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def stats(self) -> Dict[str, float]:
+        p95 = self.percentile(HEDGE_PERCENTILE)
+        return {
+            "p95_ms": p95 * 1000 if p95 is not None else 0.0,
+            "hedged": self.hedged,
+            "primary_wins": self.primaryWins,
+            "hedge_wins": self.hedgeWins,
+        }
+
+
+class Hedger:
+    """Sends a second copy of a slow request and takes whichever answers first
+
+    A request that hasn't finished by the host's p95 response time gets a
+    hedge sent alongside it. The first attempt to succeed wins and the other
+    one is cancelled, which cuts down the tail latency caused by the odd slow
+    connection or server. Only meant for idempotent requests.
+    """
+
+    def __init__(self):
+        self.windows: Dict[str, LatencyWindow] = {}
+        self.logger = logging.getLogger("rinbot")
+
+    def windowFor(self, url: str) -> LatencyWindow:
+        host = urlsplit(url).hostname or ""
+        window = self.windows.get(host)
+        if window is None:
+            window = self.windows[host] = LatencyWindow()
+        return window
+
+    def observe(self, url: str, seconds: float) -> None:
+        self.windowFor(url).observe(seconds)
+
+    async def run(self, url: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs ``send``, hedging it with a second call if it's slower than usual"""
+        window = self.windowFor(url)
+        delay = window.percentile(HEDGE_PERCENTILE)
+        if delay is None:
+            return await send()
+        primary = asyncio.ensure_future(send())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=max(delay, MIN_HEDGE_DELAY))
+            if done:
+                return primary.result()
+
+            window.hedged += 1
+            hedge = asyncio.ensure_future(send())
+            tasks.append(hedge)
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is primary:
+                            window.primaryWins += 1
+                        else:
+                            window.hedgeWins += 1
+                        self.logger.debug(
+                            f"Hedged request to {url} won by the {'primary' if task is primary else 'hedge'}"
+                        )
+                        return task.result()
+            # Both attempts failed, so report it the way an unhedged request would
+            return primary.result()
+        finally:
+            # Also reached when the caller is cancelled, e.g. once its budget
+            # runs out, which mustn't leave either attempt running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Latency and hedging outcomes, per host"""
+        return {host: window.stats() for host, window in self.windows.items()}
@@ -0,0 +1,310 @@
+import asyncio
+import time
+from ssl import SSLContext
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+import simdjson
+from Libs.cache import ResponseCache, authScopeOf, makeKey
+from Libs.hedging import Hedger
+from Libs.metrics import (
+    JSON_PARSE_TIME,
+    UPSTREAM_BYTES,
+    UPSTREAM_ERRORS,
+    UPSTREAM_LATENCY,
+    UPSTREAM_RESPONSES,
+    UPSTREAM_REVALIDATIONS,
+)
+from Libs.ratelimit import RateLimiter
+from Libs.singleflight import SingleFlight
+from Libs.tracing import span
+from multidict import CIMultiDict
+
+# Rin talks to a small set of upstream hosts over and over again, so the
+# connector is tuned to keep those connections (and their DNS answers) warm
+# instead of paying for a new DNS lookup, TCP and TLS handshake per command
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 16
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+# aiohttp waits up to 5 minutes by default, far past the point where the
+# interaction that made the request has given up. Service clients pass
+# their own, tighter timeouts per request
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=8)
+
+# Response headers that identify a version of a resource, and the request
+# headers that ask whether it's still current
+VALIDATORS = (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
+
+jsonParser = simdjson.Parser()
+
+
+def unbox(value: Any) -> Any:
+    """Turns a lazily parsed simdjson value into plain dicts and lists"""
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def resolvePointer(data: Any, pointer: str) -> Any:
+    """Looks up a JSON pointer in a document that has already been materialized"""
+    for token in pointer.split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        data = data[int(token)] if isinstance(data, list) else data[token]
+    return data
+
+
+def createConnector(
+    resolver: Optional[aiohttp.abc.AbstractResolver] = None,
+    ssl: Union[SSLContext, bool] = True,
+) -> aiohttp.TCPConnector:
+    """Creates the pooled connector shared by every upstream request
+
+    Must be called while the event loop is running, as the aiodns resolver
+    binds itself to the current loop. The benchmarks pass their own
+    ``resolver`` and ``ssl`` context to point every host at a local stub.
+    """
+    return aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        enable_cleanup_closed=True,
+        resolver=resolver if resolver is not None else aiohttp.AsyncResolver(),
+        ssl=ssl,
+    )
+
+
+def createSession(
+    connector: Optional[aiohttp.TCPConnector] = None,
+    traceConfigs: Optional[List[aiohttp.TraceConfig]] = None,
+) -> aiohttp.ClientSession:
+    """Creates the long-lived session that RinCore owns for its lifetime"""
+    return aiohttp.ClientSession(
+        connector=connector if connector is not None else createConnector(),
+        json_serialize=orjson.dumps,
+        timeout=DEFAULT_TIMEOUT,
+        trace_configs=traceConfigs,
+    )
+
+
+class Response:
+    """A fully read upstream response, which is safe to cache and share
+
+    ``viewModels`` holds what each transform made of the body, so cached
+    responses aren't transformed again. See ``Libs.offload``.
+    """
+
+    __slots__ = ("status", "headers", "body", "viewModels", "_data")
+
+    def __init__(self, status: int, headers: CIMultiDict, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.viewModels: Dict[Hashable, Any] = {}
+        self._data = None
+
+    @property
+    def data(self) -> Any:
+        """The JSON body, parsed once on first access"""
+        if self._data is None:
+            with span("parse", mode="full", bytes=self.size):
+                start = time.perf_counter()
+                self._data = jsonParser.parse(self.body, recursive=True)
+                JSON_PARSE_TIME.labels("full").observe(time.perf_counter() - start)
+        return self._data
+
+    def pick(self, *pointers: str) -> Any:
+        """Reads only the values at the given JSON pointers out of the body
+
+        Nothing but the picked values are turned into Python objects, which
+        is a lot cheaper than ``data`` when an embed only shows a few fields
+        of a large document. Gives back a single value for one pointer and a
+        tuple for several. Missing fields raise KeyError or IndexError, the
+        same as indexing into ``data`` would.
+        """
+        if self._data is not None:
+            values = tuple(resolvePointer(self._data, pointer) for pointer in pointers)
+        else:
+            values = self._readLazily(
+                lambda doc: tuple(
+                    unbox(doc.at_pointer(pointer)) for pointer in pointers
+                )
+            )
+        return values[0] if len(values) == 1 else values
+
+    def pickItems(self, pointer: str = "", exclude: Iterable[str] = ()) -> Dict:
+        """Reads the fields of one object in the body, skipping the excluded ones
+
+        Excluded fields are never turned into Python objects, so this suits
+        the embeds that list out every field of a response but a few large
+        ones.
+        """
+        exclude = set(exclude)
+        if self._data is not None:
+            obj = resolvePointer(self._data, pointer)
+            return {key: value for key, value in obj.items() if key not in exclude}
+        return self._readLazily(
+            lambda doc: {
+                key: unbox(value)
+                for key, value in doc.at_pointer(pointer).items()
+                if key not in exclude
+            }
+        )
+
+    def _readLazily(self, read: Callable[[Any], Any]) -> Any:
+        # The shared parser refuses to parse again while any proxy it handed
+        # out is still alive, so none of them are allowed to leave this call,
+        # not even through the traceback of a missing field
+        with span("parse", mode="lazy", bytes=self.size):
+            start = time.perf_counter()
+            doc = jsonParser.parse(self.body)
+            try:
+                return read(doc)
+            except LookupError as e:
+                error = type(e)(*e.args)
+            finally:
+                del doc
+                JSON_PARSE_TIME.labels("lazy").observe(time.perf_counter() - start)
+            raise error
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def cacheable(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """The conditional request headers that revalidate this response"""
+        return {
+            condition: self.headers[header]
+            for header, condition in VALIDATORS
+            if header in self.headers
+        }
+
+    def revalidated(self, notModified: "Response") -> "Response":
+        """Takes on any new validators from a 304 answer to a conditional request for this response"""
+        for header, _ in VALIDATORS:
+            if header in notModified.headers:
+                self.headers[header] = notModified.headers[header]
+        return self
+
+
+class HTTPClient:
+    """Makes upstream requests through the shared session and response cache
+
+    Identical GET requests that are made while one of them is still in
+    flight share that one request instead of each going upstream. Requests
+    that do go upstream are paced by the rate limiter of the host, and the
+    time each one takes is recorded so slow GETs can be hedged.
+
+    Cached responses that carry an ETag or Last-Modified header are
+    revalidated with a conditional request once they go stale. On a 304 the
+    cached response, along with its parsed body and view models, is served
+    again, which costs neither bandwidth nor (on GitHub) rate limit.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        cache: ResponseCache,
+        inflight: SingleFlight,
+        limiter: RateLimiter,
+        hedger: Hedger,
+    ):
+        self.session = session
+        self.cache = cache
+        self.inflight = inflight
+        self.limiter = limiter
+        self.hedger = hedger
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        ttl: Optional[int] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        hedge: bool = False,
+    ) -> Response:
+        """Sends a GET request, serving it from the cache where possible
+
+        Args:
+            url (str): The URL to request
+            params (Optional[Dict]): The query parameters to send
+            headers (Optional[Dict]): The headers to send
+            ttl (Optional[int]): Overrides the host's TTL. Use 0 for endpoints that return random results
+            timeout (Optional[aiohttp.ClientTimeout]): Overrides the session's timeouts for the request
+            hedge (bool): Whether to send a second copy if the first is slower than the host's p95
+        """
+
+        async def fetch(conditions: Optional[Dict[str, str]] = None) -> Response:
+            sent = {**(headers or {}), **conditions} if conditions else headers
+            if hedge:
+                return await self.hedger.run(
+                    url, lambda: self.request("GET", url, headers=sent, **kwargs)
+                )
+            return await self.request("GET", url, headers=sent, **kwargs)
+
+        async def revalidate(previous: Response) -> Response:
+            conditions = previous.validators
+            response = await fetch(conditions)
+            if not conditions:
+                return response
+            host = urlsplit(url).hostname or ""
+            if response.status == 304:
+                UPSTREAM_REVALIDATIONS.labels(host, "not_modified").inc()
+                return previous.revalidated(response)
+            UPSTREAM_REVALIDATIONS.labels(host, "modified").inc()
+            return response
+
+        kwargs = {"params": params}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        if ttl is None:
+            ttl = self.cache.ttlFor(url)
+        if ttl <= 0:
+            # Random endpoints should give each caller their own result
+            return await fetch()
+        key = makeKey("GET", url, params, authScopeOf(headers))
+        return await self.cache.getOrFetch(
+            key,
+            lambda: self.inflight.do(key, fetch),
+            ttl,
+            lambda previous: self.inflight.do(key, lambda: revalidate(previous)),
+        )
+
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        """Sends a request without going through the cache
+
+        Raises:
+            RateLimitedError: The host is rate limited for longer than the request may wait
+        """
+        host = urlsplit(url).hostname or ""
+        with span("ratelimit", host=host):
+            await self.limiter.acquire(url)
+        start = time.perf_counter()
+        try:
+            with span("fetch", host=host, method=method) as stage:
+                async with self.session.request(method, url, **kwargs) as r:
+                    body = await r.read()
+                    response = Response(r.status, CIMultiDict(r.headers), body)
+                stage.set(status=response.status, bytes=response.size)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            UPSTREAM_ERRORS.labels(host, type(e).__name__).inc()
+            raise
+        elapsed = time.perf_counter() - start
+        self.hedger.observe(url, elapsed)
+        self.limiter.update(url, response.status, response.headers)
+        UPSTREAM_LATENCY.labels(host).observe(elapsed)
+        UPSTREAM_RESPONSES.labels(host, response.status).inc()
+        UPSTREAM_BYTES.labels(host).inc(response.size)
+        return response
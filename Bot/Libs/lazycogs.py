@@ -0,0 +1,326 @@
+import asyncio
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import discord
+from discord.utils import MISSING
+
+# Bumped whenever the layout of the manifest changes
+MANIFEST_VERSION = 1
+
+MANIFEST_PATH = Path(__file__).parents[1].joinpath(".cog-manifest.json")
+COGS_PATH = Path(__file__).parents[1].joinpath("Cogs")
+
+# What py-cord compares against Discord's copy of a command when syncing, on
+# top of the payload from ``to_dict``
+SYNCED_ATTRIBUTES = (
+    "name",
+    "description",
+    "nsfw",
+    "dm_permission",
+    "default_member_permissions",
+    "name_localizations",
+    "description_localizations",
+)
+
+
+def hashFile(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def commandExtension(command: discord.ApplicationCommand) -> Optional[str]:
+    """The extension a command was loaded from. Groups only know it through their cog"""
+    if command.cog is not None:
+        return command.cog.__module__
+    return command.module
+
+
+def describeCommand(command: discord.ApplicationCommand) -> Dict[str, Any]:
+    """Records what a placeholder needs to stand in for a top level command"""
+    attributes = {}
+    for name in SYNCED_ATTRIBUTES:
+        value = getattr(command, name, None)
+        if isinstance(value, discord.Permissions):
+            value = str(value.value)
+        if value is not MISSING:
+            attributes[name] = value
+    return {
+        "name": command.name,
+        "type": command.type,
+        "payload": command.to_dict(),
+        "attributes": attributes,
+    }
+
+
+class LazyCommand:
+    """Stands in for a top level command until its cog has been imported
+
+    It carries just enough for py-cord to sync it with Discord, look it up
+    by ID and list it. RinCore swaps it for the real command before
+    invoking it, which imports the cog.
+    """
+
+    def __init__(
+        self,
+        loader: "LazyCogLoader",
+        extension: str,
+        entry: Dict[str, Any],
+        guild_ids: Optional[List[int]] = None,
+    ):
+        self.loader = loader
+        self.extension = extension
+        self.module = extension
+        self.name: str = entry["name"]
+        self.type: int = entry["type"]
+        self.payload: Dict[str, Any] = entry["payload"]
+        self.id: Optional[int] = None
+        self.guild_ids = guild_ids
+        self.cog = None
+        self.parent = None
+        self.subcommands: List[Any] = []
+        self.command: Optional[discord.ApplicationCommand] = None
+        # Filled in with the bot's defaults by newer versions of py-cord
+        self.contexts = None
+        self.integration_types = None
+        for name in SYNCED_ATTRIBUTES:
+            setattr(self, name, entry["attributes"].get(name, MISSING))
+
+    def __repr__(self) -> str:
+        return f"<LazyCommand name={self.name!r} extension={self.extension!r}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def qualified_name(self) -> str:
+        return self.name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.payload)
+
+    async def invoke_autocomplete_callback(self, ctx: discord.AutocompleteContext):
+        command = self.loader.resolve(self)
+        ctx.command = command
+        return await command.invoke_autocomplete_callback(ctx)
+
+
+class LazyCogLoader:
+    """Loads the cogs under ``cogsPath``, optionally deferring their imports until first use
+
+    Eagerly loaded cogs are described in a manifest, keyed by a hash of the
+    cog's file. In lazy mode, a cog whose file still matches its entry has
+    placeholders registered for its commands instead, and is only imported
+    when one of them is run. Cogs with listeners or without commands, and
+    cogs that have changed since the manifest was written, are always
+    loaded eagerly, which also brings their entries up to date.
+
+    Every import is timed, along with the top level packages it pulled in,
+    for the profile logged at startup.
+    """
+
+    def __init__(
+        self, bot: discord.Bot, cogsPath: Path, manifestPath: Path = MANIFEST_PATH
+    ):
+        self.bot = bot
+        self.cogsPath = cogsPath
+        self.manifestPath = manifestPath
+        self.logger = logging.getLogger("rinbot")
+        self.manifest = self._readManifest()
+        self.deferred: Dict[str, List[LazyCommand]] = {}
+        self.profile: Dict[str, Tuple[float, List[str]]] = {}
+
+    def _readManifest(self) -> Dict[str, Any]:
+        empty = {
+            "version": MANIFEST_VERSION,
+            "discord": discord.__version__,
+            "cogs": {},
+        }
+        try:
+            manifest = json.loads(self.manifestPath.read_bytes())
+        except (OSError, ValueError):
+            return empty
+        if (
+            manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("discord") != discord.__version__
+        ):
+            return empty
+        return manifest
+
+    def _writeManifest(self) -> None:
+        tmpPath = self.manifestPath.with_suffix(".tmp")
+        try:
+            tmpPath.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+            os.replace(tmpPath, self.manifestPath)
+        except OSError as e:
+            self.logger.warning(f"Cog manifest could not be written: {e}")
+
+    def load(self, lazy: bool = False) -> None:
+        """Loads every cog, deferring the ones the manifest can stand in for when ``lazy`` is set"""
+        changed = False
+        for path in sorted(self.cogsPath.rglob("*.py")):
+            extension = f"Cogs.{path.stem}"
+            digest = hashFile(path)
+            entry = self.manifest["cogs"].get(extension)
+            if (
+                lazy
+                and entry is not None
+                and entry["hash"] == digest
+                and not entry["eager"]
+            ):
+                self._defer(extension, entry)
+                continue
+            self.importCog(extension)
+            described = self._describe(extension, digest)
+            if described != entry:
+                self.manifest["cogs"][extension] = described
+                changed = True
+        if changed:
+            self._writeManifest()
+
+    def _describe(self, extension: str, digest: str) -> Dict[str, Any]:
+        cogs = [cog for cog in self.bot.cogs.values() if cog.__module__ == extension]
+        commands = [
+            command
+            for command in self.bot.pending_application_commands
+            if commandExtension(command) == extension and command.parent is None
+        ]
+        return {
+            "hash": digest,
+            "eager": not commands or any(cog.get_listeners() for cog in cogs),
+            "cogs": {cog.__cog_name__: cog.__doc__ for cog in cogs},
+            "commands": [describeCommand(command) for command in commands],
+        }
+
+    def _defer(self, extension: str, entry: Dict[str, Any]) -> None:
+        placeholders = [
+            LazyCommand(self, extension, command) for command in entry["commands"]
+        ]
+        for placeholder in placeholders:
+            self.bot.add_application_command(placeholder)
+        self.deferred[extension] = placeholders
+        self.logger.debug(f"Deferred Cog: {extension[5:]}")
+
+    def importCog(self, extension: str) -> None:
+        """Loads a cog's extension, recording how long it took and the packages it imported"""
+        before = set(sys.modules)
+        start = time.perf_counter()
+        self.bot.load_extension(extension)
+        elapsed = time.perf_counter() - start
+        packages = {name.partition(".")[0] for name in sys.modules.keys() - before}
+        packages -= {name.partition(".")[0] for name in before} | {"Cogs"}
+        packages = {name for name in packages if not name.startswith("_")}
+        self.profile[extension] = (elapsed, sorted(packages))
+        self.logger.debug(f"Loaded Cog: {extension[5:]}")
+
+    def importDeferred(self, extension: str) -> None:
+        """Imports a deferred cog, handing its placeholders' IDs to the real commands"""
+        placeholders = self.deferred.pop(extension, None)
+        if placeholders is None:
+            return
+        for placeholder in placeholders:
+            self.bot._pending_application_commands.remove(placeholder)
+            if placeholder.id is not None:
+                self.bot._application_commands.pop(placeholder.id, None)
+        try:
+            self.importCog(extension)
+        except discord.DiscordException:
+            for placeholder in placeholders:
+                self.bot.add_application_command(placeholder)
+                if placeholder.id is not None:
+                    self.bot._application_commands[placeholder.id] = placeholder
+            self.deferred[extension] = placeholders
+            raise
+        for placeholder in placeholders:
+            placeholder.command = next(
+                command
+                for command in self.bot.pending_application_commands
+                if commandExtension(command) == extension
+                and command.name == placeholder.name
+                and command.type == placeholder.type
+            )
+            placeholder.command.id = placeholder.id
+            if placeholder.id is not None:
+                self.bot._application_commands[placeholder.id] = placeholder.command
+        elapsed, packages = self.profile[extension]
+        self.logger.info(
+            f"Imported {extension} on first use in {elapsed * 1000:.1f}ms"
+            + (f" ({', '.join(packages)})" if packages else "")
+        )
+
+    def resolve(self, command: LazyCommand) -> discord.ApplicationCommand:
+        """Gives back the real command a placeholder stands in for, importing its cog if need be"""
+        if command.command is None:
+            self.importDeferred(command.extension)
+        return command.command
+
+    def loadCog(self, name: str) -> Optional[discord.Cog]:
+        """Gets a cog by its name, importing it first if it was deferred"""
+        for extension in list(self.deferred):
+            if name in self.manifest["cogs"][extension]["cogs"]:
+                self.importDeferred(extension)
+        return self.bot.cogs.get(name)
+
+    def deferredCogs(self) -> Dict[str, Optional[str]]:
+        """The names and descriptions of the cogs that haven't been imported yet"""
+        return {
+            name: description
+            for extension in self.deferred
+            for name, description in self.manifest["cogs"][extension]["cogs"].items()
+        }
+
+    def report(self) -> None:
+        """Logs how long each cog took to import, slowest first"""
+        total = sum(elapsed for elapsed, _ in self.profile.values())
+        self.logger.info(
+            f"Imported {len(self.profile)} cogs in {total * 1000:.1f}ms, "
+            f"deferred {len(self.deferred)}"
+        )
+        for extension, (elapsed, packages) in sorted(
+            self.profile.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            self.logger.info(
+                f"  {extension[5:]:<28} {elapsed * 1000:>7.1f}ms"
+                + (f"  {', '.join(packages)}" if packages else "")
+            )
+
+
+def writeManifest(
+    cogsPath: Path = COGS_PATH, manifestPath: Path = MANIFEST_PATH
+) -> None:
+    """Writes the manifest for every cog under ``cogsPath`` without building RinCore
+
+    Meant for build steps, so that Lazy_Cogs can defer cogs from the very
+    first start. Each cog module is imported and its cogs are added to a
+    bare ``discord.Bot`` without running their ``__init__``, which is where
+    cogs reach for RinCore's clients. Registering their commands is all
+    describing them takes.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        bot = discord.Bot(loop=loop)
+        loader = LazyCogLoader(bot, cogsPath, manifestPath)
+        loader.manifest["cogs"] = {}
+        for path in sorted(cogsPath.rglob("*.py")):
+            extension = f"Cogs.{path.stem}"
+            module = importlib.import_module(extension)
+            for cls in vars(module).values():
+                if (
+                    inspect.isclass(cls)
+                    and issubclass(cls, discord.Cog)
+                    and cls.__module__ == extension
+                ):
+                    bot.add_cog(cls.__new__(cls))
+            loader.manifest["cogs"][extension] = loader._describe(
+                extension, hashFile(path)
+            )
+        loader._writeManifest()
+    finally:
+        loop.close()
@@ -0,0 +1,163 @@
+import asyncio
+import collections
+import logging
+import time
+from typing import Any, Coroutine, Deque, Dict, Generator, Optional
+
+from Libs.metrics import REGISTRY
+
+# How often the loop is checked on. Lag is how much later than this the
+# check actually gets to run
+SAMPLE_INTERVAL = 0.1
+
+# A single step of a coroutine that holds the loop for longer than this is
+# logged. Discord's heartbeat is only sent from the loop too, so long stalls
+# show up as gateway latency
+SLOW_CALLBACK_THRESHOLD = 0.1
+
+# Two minutes of samples at the default interval, for the stats command
+WINDOW = 1200
+
+LOOP_LAG = REGISTRY.histogram(
+    "rin_event_loop_lag_seconds",
+    "How late the event loop ran a task scheduled to wake up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+SLOW_CALLBACKS = REGISTRY.counter(
+    "rin_slow_callbacks_total",
+    "Coroutine steps that held the event loop past the threshold",
+    ["command"],
+)
+
+
+class TimedSteps:
+    """Awaits a coroutine, timing each step it takes between suspensions
+
+    A step that runs for longer than the threshold is blocking everything
+    else on the loop, so it's reported to the monitor along with the name of
+    the command that ran it.
+    """
+
+    __slots__ = ("monitor", "name", "coro")
+
+    def __init__(self, monitor: "LoopMonitor", name: str, coro: Coroutine):
+        self.monitor = monitor
+        self.name = name
+        self.coro = coro
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coro = self.coro
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            start = time.perf_counter()
+            try:
+                if error is None:
+                    suspended = coro.send(value)
+                else:
+                    suspended = coro.throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self.monitor.observeStep(self.name, time.perf_counter() - start)
+            try:
+                value, error = (yield suspended), None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
+
+class LoopMonitor:
+    """Continuously measures event loop lag and catches the commands causing it
+
+    Lag is sampled by a task that sleeps for ``interval`` and checks how late
+    it woke up. Commands are run through ``timed``, which logs any step that
+    holds the loop past ``threshold``. Stalls that no command step accounts
+    for are logged with the commands that were running at the time.
+    """
+
+    def __init__(
+        self,
+        interval: float = SAMPLE_INTERVAL,
+        threshold: float = SLOW_CALLBACK_THRESHOLD,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.samples: Deque[float] = collections.deque(maxlen=WINDOW)
+        self.maxLag = 0.0
+        self.slowCallbacks: Dict[str, int] = {}
+        self.slowest: Dict[str, float] = {}
+        self.running: Dict[str, int] = {}
+        self.logger = logging.getLogger("rinbot")
+        self._blamed = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Starts sampling lag. Must be called while the event loop is running"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._sample())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.perf_counter()
+            self._blamed = False
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self.samples.append(lag)
+            self.maxLag = max(self.maxLag, lag)
+            LOOP_LAG.labels().observe(lag)
+            if lag > self.threshold and not self._blamed:
+                running = ", ".join(sorted(self.running)) or "no commands"
+                self.logger.warning(
+                    f"Event loop stalled for {lag * 1000:.0f}ms while running {running}"
+                )
+
+    def observeStep(self, name: str, seconds: float) -> None:
+        if seconds <= self.threshold:
+            return
+        self._blamed = True
+        self.slowCallbacks[name] = self.slowCallbacks.get(name, 0) + 1
+        self.slowest[name] = max(self.slowest.get(name, 0.0), seconds)
+        SLOW_CALLBACKS.labels(name).inc()
+        self.logger.warning(
+            f"Slow callback in /{name} held the event loop for {seconds * 1000:.0f}ms"
+        )
+
+    async def timed(self, name: str, coro: Coroutine) -> Any:
+        """Runs a command's coroutine, reporting any step of it that blocks the loop"""
+        self.running[name] = self.running.get(name, 0) + 1
+        try:
+            return await TimedSteps(self, name, coro)
+        finally:
+            self.running[name] -= 1
+            if not self.running[name]:
+                del self.running[name]
+
+    def percentile(self, fraction: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "lag_p50_ms": self.percentile(0.5) * 1000,
+            "lag_p99_ms": self.percentile(0.99) * 1000,
+            "lag_max_ms": self.maxLag * 1000,
+            "slow_callbacks": sum(self.slowCallbacks.values()),
+            "commands": {
+                name: {"slow_callbacks": count, "slowest_ms": self.slowest[name] * 1000}
+                for name, count in self.slowCallbacks.items()
+            },
+        }
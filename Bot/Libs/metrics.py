@@ -0,0 +1,269 @@
+import bisect
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+# Prometheus' own default buckets, which suit command and request latencies
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PARSE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A collector returns the (labels, value) samples of a gauge when scraped
+Samples = Iterable[Tuple[Dict[str, str], float]]
+
+
+def escapeLabel(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def formatLabels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{escapeLabel(str(val))}"' for key, val in labels.items())
+    return f"{{{pairs}}}"
+
+
+def formatValue(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base for a metric family that has one child per set of label values"""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelNames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelNames = tuple(labelNames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelNames):
+            raise ValueError(f"{self.name} expects labels {self.labelNames}")
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._newChild()
+        return child
+
+    def _newChild(self):
+        raise NotImplementedError
+
+    def _labelDict(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelNames, key))
+
+    def expose(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for key, child in self._children.items():
+            lines.extend(self._exposeChild(self._labelDict(key), child))
+        return lines
+
+    def _exposeChild(self, labels: Dict[str, str], child) -> List[str]:
+        raise NotImplementedError
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Counter(Metric):
+    """A value that only ever goes up"""
+
+    type = "counter"
+
+    def _newChild(self) -> CounterChild:
+        return CounterChild()
+
+    def _exposeChild(self, labels: Dict[str, str], child: CounterChild) -> List[str]:
+        return [f"{self.name}{formatLabels(labels)} {formatValue(child.value)}"]
+
+
+class HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(Metric):
+    """Counts observations into cumulative buckets, Prometheus style"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelNames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _newChild(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _exposeChild(self, labels: Dict[str, str], child: HistogramChild) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, child.counts):
+            cumulative += count
+            bucketLabels = formatLabels({**labels, "le": formatValue(float(bound))})
+            lines.append(f"{self.name}_bucket{bucketLabels} {cumulative}")
+        infLabels = formatLabels({**labels, "le": "+Inf"})
+        lines.append(f"{self.name}_bucket{infLabels} {child.count}")
+        lines.append(f"{self.name}_sum{formatLabels(labels)} {formatValue(child.sum)}")
+        lines.append(f"{self.name}_count{formatLabels(labels)} {child.count}")
+        return lines
+
+
+class GaugeCollector:
+    """A gauge whose samples are read from a callback every time it's scraped"""
+
+    def __init__(self, name: str, documentation: str, collect: Callable[[], Samples]):
+        self.name = name
+        self.documentation = documentation
+        self.collect = collect
+
+    def expose(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+        ]
+        for labels, value in self.collect():
+            lines.append(f"{self.name}{formatLabels(labels)} {formatValue(value)}")
+        return lines
+
+
+class Registry:
+    """Holds every metric and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"{metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelNames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelNames))
+
+    def histogram(
+        self, name: str, documentation: str, labelNames=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelNames, buckets))
+
+    def gauge(
+        self, name: str, documentation: str, collect: Callable[[], Samples]
+    ) -> GaugeCollector:
+        """Registers a gauge, replacing any earlier one with the same name"""
+        self.metrics.pop(name, None)
+        return self.register(GaugeCollector(name, documentation, collect))
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+COMMAND_INVOCATIONS = REGISTRY.counter(
+    "rin_command_invocations_total", "Slash command invocations", ["command"]
+)
+COMMAND_ERRORS = REGISTRY.counter(
+    "rin_command_errors_total", "Slash commands that raised", ["command", "error"]
+)
+COMMAND_LATENCY = REGISTRY.histogram(
+    "rin_command_duration_seconds",
+    "Time taken to run a slash command",
+    ["command", "deferred"],
+)
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    "rin_upstream_request_duration_seconds",
+    "Time taken by requests to upstream APIs",
+    ["host"],
+)
+UPSTREAM_RESPONSES = REGISTRY.counter(
+    "rin_upstream_responses_total",
+    "Responses from upstream APIs by status",
+    ["host", "status"],
+)
+UPSTREAM_ERRORS = REGISTRY.counter(
+    "rin_upstream_errors_total",
+    "Upstream requests that failed without a response",
+    ["host", "error"],
+)
+UPSTREAM_REVALIDATIONS = REGISTRY.counter(
+    "rin_upstream_revalidations_total",
+    "Conditional requests for cached responses, by whether the upstream sent a new body",
+    ["host", "outcome"],
+)
+UPSTREAM_BYTES = REGISTRY.counter(
+    "rin_upstream_response_bytes_total",
+    "Body bytes received from upstream APIs",
+    ["host"],
+)
+JSON_PARSE_TIME = REGISTRY.histogram(
+    "rin_json_parse_seconds",
+    "Time spent parsing upstream JSON, fully or lazily",
+    ["mode"],
+    buckets=PARSE_BUCKETS,
+)
+
+
+class MetricsServer:
+    """Serves the registry at /metrics over a local HTTP endpoint"""
+
+    def __init__(self, host: str, port: int, registry: Registry = REGISTRY):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.runner: Optional[web.AppRunner] = None
+        self.logger = logging.getLogger("rinbot")
+
+    async def handleMetrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.expose().encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", self.handleMetrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        self.logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
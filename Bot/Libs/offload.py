@@ -0,0 +1,204 @@
+import asyncio
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import discord
+import orjson
+from Libs.http import Response
+from Libs.metrics import REGISTRY
+from Libs.paginator import RENDER_ERRORS, LazyPages
+from Libs.tracing import span
+
+# Below this many bytes, parsing and transforming a payload on the loop is
+# quicker than handing it to a worker and waiting for the result
+OFFLOAD_THRESHOLD = 64 * 1024
+
+OFFLOAD_MODES = ("thread", "process")
+
+TRANSFORMS = REGISTRY.counter(
+    "rin_payload_transforms_total",
+    "Payloads turned into view models, by where the work ran",
+    ["where"],
+)
+
+T = TypeVar("T")
+
+
+def field(name: str, value: Any, inline: bool = True) -> Tuple[str, str, bool]:
+    """An embed field for a view model, with its value stringified the way ``add_field`` would"""
+    return name, str(value), inline
+
+
+def renderEmbed(model: Dict[str, Any]) -> discord.Embed:
+    """Builds an embed out of a view model produced by a transform
+
+    A view model is a plain dict with any of ``title``, ``description``,
+    ``color`` (as an int), ``fields`` (made with ``field``), ``thumbnail``
+    and ``image``. Everything in it is already formatted, so this is only
+    a matter of copying it over.
+    """
+    embed = discord.Embed(
+        title=model.get("title"),
+        description=model.get("description"),
+        color=model.get("color"),
+    )
+    for name, value, inline in model.get("fields", ()):
+        embed.add_field(name=name, value=value, inline=inline)
+    if model.get("thumbnail") is not None:
+        embed.set_thumbnail(url=model["thumbnail"])
+    if model.get("image") is not None:
+        embed.set_image(url=model["image"])
+    return embed
+
+
+def parseAndTransform(body: bytes, transform: Callable[[Any], T]) -> T:
+    return transform(orjson.loads(body))
+
+
+def allRecords(data: Any) -> List:
+    return data
+
+
+def parseAndTransformEach(
+    body: bytes, transform: Callable[[Any], T], select: Callable[[Any], List]
+) -> List:
+    """Transforms every record, keeping the error in place of any that fails"""
+    models = []
+    for record in select(orjson.loads(body)):
+        try:
+            models.append(transform(record))
+        except RENDER_ERRORS as e:
+            models.append(e)
+    return models
+
+
+def raiseFailed(model: Any) -> Any:
+    if isinstance(model, Exception):
+        raise model
+    return model
+
+
+def initWorker(modules: Tuple[str, ...]) -> None:
+    """Imports the modules transforms come from when a worker process starts
+
+    Spawned workers also run the bot's entry script as ``__mp_main__``,
+    which is why rinbot.py only builds RinCore in ``main``. Transforms from
+    any other module are imported when they're first unpickled, so a worker
+    only ever holds the transforms and what they need, never a bot.
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+
+class Offloader:
+    """Runs payload-to-view-model transforms off the event loop once payloads get large
+
+    Transforms take the parsed JSON body and give back plain data, which
+    ``renderEmbed`` turns into embeds on the loop. Payloads past
+    ``threshold`` bytes are parsed and transformed in a worker pool instead
+    of on the loop. Threads are the default, which still share the GIL but
+    let the loop in every few milliseconds rather than stalling it for the
+    whole transform. Processes run truly in parallel, at the cost of
+    pickling the body and the result, and need the transform to be a module
+    level function.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        workers: Optional[int] = None,
+        threshold: int = OFFLOAD_THRESHOLD,
+    ):
+        if mode not in OFFLOAD_MODES:
+            raise ValueError(
+                f"Unknown offload mode {mode}, expected one of {OFFLOAD_MODES}"
+            )
+        self.mode = mode
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.threshold = threshold
+        self._executor: Optional[Executor] = None
+
+    def _getExecutor(self, transform: Callable[[Any], T]) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                # Forking would copy the running loop and the gateway's sockets
+                self._executor = ProcessPoolExecutor(
+                    self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initWorker,
+                    initargs=((transform.__module__,),),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="rin-offload"
+                )
+        return self._executor
+
+    async def transform(self, response: Response, transform: Callable[[Any], T]) -> T:
+        """Turns a response's JSON body into a view model with ``transform``
+
+        The result is kept on the response, and shared by every command that
+        gets the same response out of the cache, so it must not be mutated.
+        """
+        if transform in response.viewModels:
+            return response.viewModels[transform]
+        if response.size < self.threshold:
+            TRANSFORMS.labels("loop").inc()
+            data = response.data
+            with span("transform", offloaded=False):
+                model = transform(data)
+        else:
+            TRANSFORMS.labels(self.mode).inc()
+            with span("transform", offloaded=True, mode=self.mode, bytes=response.size):
+                model = await asyncio.get_running_loop().run_in_executor(
+                    self._getExecutor(transform),
+                    parseAndTransform,
+                    response.body,
+                    transform,
+                )
+        response.viewModels[transform] = model
+        return model
+
+    async def transformEach(
+        self,
+        response: Response,
+        transform: Callable[[Any], T],
+        select: Callable[[Any], List] = allRecords,
+    ) -> LazyPages:
+        """Turns each record ``select`` picks out of a response into a view model with ``transform``
+
+        Small payloads keep their raw records, and a record is only
+        transformed once its page is first looked up, so the first page
+        is shown without building the rest. Past ``threshold`` every
+        record is transformed in the pool at once. Either way a record
+        that fails to transform only raises when its own page is shown,
+        where ``LazyPaginator`` swaps in an error page. The models are
+        kept on the response, the same as ``transform``.
+        """
+        key = (transform, select)
+        if key in response.viewModels:
+            return response.viewModels[key]
+        if response.size < self.threshold:
+            TRANSFORMS.labels("loop").inc()
+            models = LazyPages(select(response.data), transform)
+        else:
+            TRANSFORMS.labels(self.mode).inc()
+            with span("transform", offloaded=True, mode=self.mode, bytes=response.size):
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self._getExecutor(transform),
+                    parseAndTransformEach,
+                    response.body,
+                    transform,
+                    select,
+                )
+            models = LazyPages(results, raiseFailed)
+        response.viewModels[key] = models
+        return models
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
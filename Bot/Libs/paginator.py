@@ -0,0 +1,129 @@
+import logging
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import discord
+from discord.ext import pages
+from Libs.tracing import span
+
+# What rendering a record that's missing or mangling a field tends to raise
+RENDER_ERRORS = (KeyError, IndexError, TypeError, ValueError, AttributeError)
+
+
+def errorPage() -> discord.Embed:
+    return discord.Embed(
+        description="Sorry, but this page couldn't be shown. Its data seems to be missing or malformed"
+    )
+
+
+class LazyPages(Sequence):
+    """A list of pages that are only rendered once they are looked up
+
+    Keeps hold of the raw records and calls ``render`` on one of them the
+    first time its page is shown. Rendered pages are kept, so flipping back
+    and forth doesn't build the same embed twice.
+    """
+
+    def __init__(self, records: List[Any], render: Callable[[Any], Any]):
+        self.records = records
+        self.render = render
+        self._rendered: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index not in self._rendered:
+            with span("render", page=index):
+                self._rendered[index] = self.render(self.records[index])
+        return self._rendered[index]
+
+    def setPage(self, index: int, page: Any) -> None:
+        """Shows ``page`` in place of whatever the record at ``index`` would render to"""
+        self._rendered[index] = page
+
+
+class TracedPaginator(pages.Paginator):
+    """Paginator whose first response shows up as the respond stage of a trace"""
+
+    async def respond(self, interaction: discord.Interaction, *args, **kwargs):
+        with span("respond", paginator=type(self).__name__):
+            return await super().respond(interaction, *args, **kwargs)
+
+
+class LazyPaginator(TracedPaginator):
+    """Paginator that renders pages on demand when given ``LazyPages``
+
+    The base paginator turns the default page group into a list of ``Page``
+    objects up front, which would render every page in it. This keeps that
+    conversion lazy as well, so only the pages someone actually navigates to
+    are ever built.
+    """
+
+    def get_page_group_content(self, page_group: pages.PageGroup) -> Sequence:
+        if isinstance(page_group.pages, LazyPages):
+            return LazyPages(page_group.pages, self.get_page_content)
+        return super().get_page_group_content(page_group)
+
+    async def goto_page(
+        self, page_number: int = 0, *, interaction: Optional[discord.Interaction] = None
+    ) -> None:
+        self.renderPage(page_number)
+        return await super().goto_page(page_number, interaction=interaction)
+
+    def renderPage(self, index: int) -> None:
+        """Renders a page ahead of it being shown, swapping in an error page if it can't be
+
+        Only the first page is rendered before the command responds, so a
+        malformed record further in would otherwise only blow up inside the
+        button callback and fail the interaction.
+        """
+        if not isinstance(self.pages, LazyPages):
+            return
+        try:
+            self.pages[index]
+        except RENDER_ERRORS as e:
+            logging.getLogger("rinbot").warning(
+                f"Page {index + 1} of {type(self).__name__} failed to render: {e!r}"
+            )
+            self.pages.setPage(index, self.get_page_content(errorPage()))
+
+
+class StreamingPaginator(TracedPaginator):
+    """Paginator that is sent as soon as its first page is ready and filled in as the rest arrives
+
+    Meant for commands that chain requests together. Defer the interaction,
+    ``respond`` with whatever the first request gave back, then call
+    ``setPage`` or ``addPages`` as each of the remaining requests finishes.
+    No buttons are shown while there is only a single page.
+    """
+
+    def __init__(self, pages: List[Any], **kwargs):
+        super().__init__(pages=list(pages), **kwargs)
+
+    def update_buttons(self) -> dict:
+        buttons = super().update_buttons()
+        if self.page_count == 0 and not self.show_menu and not self.custom_view:
+            self.clear_items()
+        return buttons
+
+    async def setPage(self, index: int, page: Any) -> None:
+        """Replaces a page, re-rendering the message if it's the one being shown"""
+        self.pages[index] = page
+        if index == self.current_page:
+            await self.refresh()
+
+    async def addPages(self, newPages: List[Any]) -> None:
+        """Appends pages to the end of the paginator"""
+        self.pages.extend(newPages)
+        await self.refresh()
+
+    async def refresh(self) -> None:
+        self.page_count = max(len(self.pages) - 1, 0)
+        if self.message is not None:
+            with span("respond", paginator=type(self).__name__, refresh=True):
+                await self.goto_page(self.current_page)
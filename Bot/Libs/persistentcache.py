@@ -0,0 +1,434 @@
+import asyncio
+import logging
+import sqlite3
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Union
+
+import orjson
+from Libs.cache import CacheEntry, ResponseCache
+from Libs.gqlclient import QueryResult
+from Libs.http import VALIDATORS, Response
+from Libs.resp import RESPClient, RESPError
+from multidict import CIMultiDict
+
+# What kind of value a stored record holds
+KIND_RESPONSE = 0
+KIND_QUERY_RESULT = 1
+
+# How many writes go by between sweeps for records that can't be served anymore
+PURGE_INTERVAL = 1000
+
+# How long a store that just failed is skipped, so a store that's down or
+# unreachable doesn't hold up every lookup until it's back
+STORE_COOLDOWN = 5.0
+
+# kind, status, the three deadlines and the length of the headers, ahead of
+# the headers and body in a packed record
+RECORD_HEADER = struct.Struct("<BHdddI")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key BLOB PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    headers BLOB NOT NULL,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    keep_until REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_keep_until ON responses (keep_until);
+"""
+
+
+class StoredRecord(NamedTuple):
+    """A cached value as it's kept outside of memory. Deadlines are wall clock times"""
+
+    kind: int
+    status: int
+    headers: bytes
+    body: bytes
+    expiresAt: float
+    staleUntil: float
+    keepUntil: float
+
+
+def encodeValue(value: Any, entry: CacheEntry) -> Optional[StoredRecord]:
+    """Turns a cached value into a record, or None for values that can't be stored
+
+    Only the headers that revalidate a response are kept, along with its raw
+    body, which is parsed again the first time it's read back.
+    """
+    offset = time.time() - time.monotonic()
+    deadlines = (
+        entry.expiresAt + offset,
+        entry.staleUntil + offset,
+        entry.keepUntil + offset,
+    )
+    if isinstance(value, Response):
+        headers = {
+            header: value.headers[header]
+            for header, _ in VALIDATORS
+            if header in value.headers
+        }
+        return StoredRecord(
+            KIND_RESPONSE, value.status, orjson.dumps(headers), value.body, *deadlines
+        )
+    if isinstance(value, QueryResult):
+        return StoredRecord(
+            KIND_QUERY_RESULT, 200, b"{}", orjson.dumps(value.data), *deadlines
+        )
+    return None
+
+
+def decodeValue(record: StoredRecord) -> Optional[CacheEntry]:
+    """Rebuilds the entry a record was made from, or None if it can't be served anymore"""
+    offset = time.monotonic() - time.time()
+    keepUntil = record.keepUntil + offset
+    if time.monotonic() >= keepUntil:
+        return None
+    if record.kind == KIND_RESPONSE:
+        value = Response(
+            record.status, CIMultiDict(orjson.loads(record.headers)), record.body
+        )
+    elif record.kind == KIND_QUERY_RESULT:
+        value = QueryResult(orjson.loads(record.body))
+    else:
+        return None
+    return CacheEntry(
+        value,
+        value.size,
+        record.expiresAt + offset,
+        record.staleUntil + offset,
+        keepUntil,
+    )
+
+
+def packRecord(record: StoredRecord) -> bytes:
+    """Packs a record into a single compact value, for stores that only hold bytes"""
+    return (
+        RECORD_HEADER.pack(
+            record.kind,
+            record.status,
+            record.expiresAt,
+            record.staleUntil,
+            record.keepUntil,
+            len(record.headers),
+        )
+        + record.headers
+        + record.body
+    )
+
+
+def unpackRecord(packed: bytes) -> StoredRecord:
+    (
+        kind,
+        status,
+        expiresAt,
+        staleUntil,
+        keepUntil,
+        headersLength,
+    ) = RECORD_HEADER.unpack_from(packed)
+    headersEnd = RECORD_HEADER.size + headersLength
+    return StoredRecord(
+        kind,
+        status,
+        packed[RECORD_HEADER.size : headersEnd],
+        packed[headersEnd:],
+        expiresAt,
+        staleUntil,
+        keepUntil,
+    )
+
+
+class StoreBreaker:
+    """Keeps a store out of the way for ``cooldown`` seconds after it fails"""
+
+    def __init__(self, cooldown: float = STORE_COOLDOWN):
+        self.cooldown = cooldown
+        self.downUntil = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.downUntil
+
+    def trip(self) -> None:
+        self.downUntil = time.monotonic() + self.cooldown
+
+
+class SQLiteStore:
+    """Cache records kept in a SQLite database, in WAL mode
+
+    Every statement runs on a single thread that owns the connection, so
+    the event loop never waits on the disk and writes never contend with
+    each other. Records past their ``keepUntil`` are swept out when the
+    database is opened and every ``PURGE_INTERVAL`` writes after that.
+
+    A database that can't be read or written is logged and treated as
+    empty, so the cache carries on from memory, and isn't tried again until
+    ``STORE_COOLDOWN`` has passed.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.logger = logging.getLogger("rinbot")
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rin-cache-store"
+        )
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self.breaker = StoreBreaker()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA mmap_size=268435456")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            self._purge()
+        return self._connection
+
+    def _purge(self) -> None:
+        self._connection.execute(
+            "DELETE FROM responses WHERE keep_until < ?", (time.time(),)
+        )
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        if not self.breaker.available:
+            return None
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, fn, *args
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache database {self.path} failed: {e}")
+            self.breaker.trip()
+            return None
+
+    def _get(self, key: str) -> Optional[StoredRecord]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT kind, status, headers, body, expires_at, stale_until, keep_until "
+                "FROM responses WHERE key = ?",
+                (bytes.fromhex(key),),
+            )
+            .fetchone()
+        )
+        return StoredRecord(*row) if row is not None else None
+
+    def _set(self, key: str, record: StoredRecord) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (bytes.fromhex(key), *record),
+        )
+        self._writes += 1
+        if self._writes % PURGE_INTERVAL == 0:
+            self._purge()
+
+    def _delete(self, key: str) -> None:
+        self._connect().execute(
+            "DELETE FROM responses WHERE key = ?", (bytes.fromhex(key),)
+        )
+
+    def _clear(self) -> None:
+        self._connect().execute("DELETE FROM responses")
+
+    def _count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def get(self, key: str) -> Optional[StoredRecord]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, record: StoredRecord) -> None:
+        await self._run(self._set, key, record)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear)
+
+    async def count(self) -> int:
+        return await self._run(self._count) or 0
+
+    async def close(self) -> None:
+        # Closed even while the breaker is tripped, unlike everything else
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._close
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache database {self.path} failed: {e}")
+        self._executor.shutdown(wait=False)
+
+
+class RESPStore:
+    """Cache records kept on a server that speaks the Redis protocol, shared by every process using it
+
+    Records are packed with ``packRecord`` under ``prefix`` and expire on
+    the server once they can't be served anymore, so nothing has to sweep
+    them. A server that can't be reached, or that takes longer than the
+    client's timeout, is logged and treated as empty, and isn't tried again
+    until ``STORE_COOLDOWN`` has passed.
+    """
+
+    def __init__(self, client: RESPClient, prefix: str = "rin:cache:"):
+        self.client = client
+        self.prefix = prefix
+        self.logger = logging.getLogger("rinbot")
+        self.breaker = StoreBreaker()
+
+    async def _run(self, fn: Callable[..., Awaitable[Any]], *args) -> Any:
+        if not self.breaker.available:
+            return None
+        try:
+            return await fn(*args)
+        except (RESPError, ConnectionError, OSError, asyncio.TimeoutError) as e:
+            self.logger.warning(
+                f"Response cache server {self.client.host}:{self.client.port} failed: {e!r}"
+            )
+            self.breaker.trip()
+            return None
+
+    async def _keys(self) -> List[bytes]:
+        keys = []
+        cursor = b"0"
+        while True:
+            cursor, batch = await self.client.execute(
+                "SCAN", cursor, "MATCH", f"{self.prefix}*", "COUNT", 1000
+            )
+            keys.extend(batch)
+            if cursor == b"0":
+                return keys
+
+    async def get(self, key: str) -> Optional[StoredRecord]:
+        packed = await self._run(self.client.execute, "GET", self.prefix + key)
+        return unpackRecord(packed) if packed is not None else None
+
+    async def set(self, key: str, record: StoredRecord) -> None:
+        await self._run(
+            self.client.execute,
+            "SET",
+            self.prefix + key,
+            packRecord(record),
+            "PXAT",
+            int(record.keepUntil * 1000),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._run(self.client.execute, "DEL", self.prefix + key)
+
+    async def clear(self) -> None:
+        """Deletes every record under the prefix, leaving the rest of the server alone"""
+        keys = await self._run(self._keys)
+        if keys:
+            await self._run(
+                self.client.pipeline,
+                [("DEL", *keys[i : i + 1000]) for i in range(0, len(keys), 1000)],
+            )
+
+    async def count(self) -> int:
+        return len(await self._run(self._keys) or [])
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class PersistentResponseCache(ResponseCache):
+    """ResponseCache that writes every entry through to a store that outlives the process
+
+    Memory stays the first tier, bounded and evicted as usual. A key that
+    isn't in memory is looked up in ``store`` and brought back into memory
+    if it can still be served, so a restarted bot picks up where it left
+    off, stale-while-revalidate and conditional requests included. With a
+    RESPStore, every process sharing the server also shares what the others
+    have fetched. Only Responses and QueryResults are written to the store.
+
+    Writes to the store happen in the background, so a command never waits
+    on one. Writes to the same key land in the order they were made, and
+    deleting a key, clearing the cache or closing it waits for the writes
+    still pending.
+    """
+
+    def __init__(self, store: Union[SQLiteStore, RESPStore], **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.storeHits = 0
+        self._pendingWrites: Dict[str, asyncio.Task] = {}
+
+    def stats(self) -> Dict[str, int]:
+        return {**super().stats(), "store_hits": self.storeHits}
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = await super().get(key)
+        if entry is not None:
+            return entry
+        record = await self.store.get(key)
+        if record is None:
+            return None
+        entry = decodeValue(record)
+        if entry is None or entry.size > self.maxBytes:
+            return None
+        self._insert(key, entry)
+        self.storeHits += 1
+        return entry
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await super().set(key, value, ttl)
+        entry = self._entries.get(key)
+        if entry is None or entry.value is not value:
+            return
+        record = encodeValue(value, entry)
+        if record is not None:
+            previous = self._pendingWrites.get(key)
+            task = asyncio.create_task(self._write(key, record, previous))
+            self._pendingWrites[key] = task
+            task.add_done_callback(lambda done: self._writeDone(key, done))
+
+    async def _write(
+        self, key: str, record: StoredRecord, previous: Optional[asyncio.Task]
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait({previous})
+        await self.store.set(key, record)
+
+    def _writeDone(self, key: str, task: asyncio.Task) -> None:
+        if self._pendingWrites.get(key) is task:
+            del self._pendingWrites[key]
+
+    async def flush(self, key: Optional[str] = None) -> None:
+        """Waits for the writes still on their way to the store, or only the one for ``key``"""
+        if key is not None:
+            pending = (
+                {self._pendingWrites[key]} if key in self._pendingWrites else set()
+            )
+        else:
+            pending = set(self._pendingWrites.values())
+        if pending:
+            await asyncio.wait(pending)
+
+    async def delete(self, key: str) -> None:
+        await super().delete(key)
+        await self.flush(key)
+        await self.store.delete(key)
+
+    async def clear(self) -> None:
+        """Drops every entry, in memory and in the store"""
+        await super().clear()
+        await self.flush()
+        await self.store.clear()
+
+    async def close(self) -> None:
+        await self.flush()
+        await self.store.close()
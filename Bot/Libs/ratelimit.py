@@ -0,0 +1,220 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Documented request quotas as (requests per second, burst). Hosts that are
+# not listed aren't paced, but still back off when they answer with
+# Retry-After or an exhausted X-RateLimit-* window
+SERVICE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "api.jikan.moe": (1, 3),  # 60/min, 3/s
+    "api.mangadex.org": (5, 5),  # 5/s per IP
+    "api.github.com": (5000 / 3600, 30),  # 5000/hour with a token
+    "graphql.anilist.co": (1.5, 5),  # 90/min
+    "api.twitter.com": (450 / 900, 10),  # 450 per 15 min app window
+    # YouTube's real limit is a daily unit quota, which can't be paced
+    # usefully per second. This only keeps bursts from burning through it
+    "www.googleapis.com": (1, 5),
+}
+
+# Interactions have to be answered within 3 seconds, so anything that would
+# be queued longer than this is turned away instead
+DEFAULT_MAX_WAIT = 2.5
+DEFAULT_MAX_QUEUE = 32
+
+# Upper bound on how long an upstream header can pause a host for
+MAX_PAUSE = 900
+
+
+class RateLimitedError(Exception):
+    """Raised when a request can't be sent within the time it's allowed to wait"""
+
+    def __init__(self, host: str, retryAfter: float):
+        self.host = host
+        self.retryAfter = retryAfter
+        super().__init__(f"{host} is rate limited, retry in {retryAfter:.1f}s")
+
+
+def parseRetryAfter(value: str) -> Optional[float]:
+    """Parses a Retry-After header, which is either seconds or an HTTP date"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def parseReset(value: str) -> Optional[float]:
+    """Parses an X-RateLimit-Reset header into seconds from now
+
+    GitHub and MangaDex send an epoch timestamp while others send the number
+    of seconds left in the window, so anything that looks like a timestamp is
+    treated as one.
+    """
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    return reset - time.time() if reset > 1e9 else reset
+
+
+class TokenBucket:
+    """Paces the requests sent to a single host
+
+    Requests take a token each, which refill at ``rate`` per second up to
+    ``burst``. Waiting requests are served in order. A request is rejected
+    with RateLimitedError straight away when the queue is full or when it
+    couldn't be sent within ``maxWait``. A ``rate`` of None means the host
+    is only paused by upstream headers.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        maxQueue: int = DEFAULT_MAX_QUEUE,
+        maxWait: float = DEFAULT_MAX_WAIT,
+    ):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.maxQueue = maxQueue
+        self.maxWait = maxWait
+        self.tokens = float(burst)
+        self.updatedAt = time.monotonic()
+        self.pausedUntil = 0.0
+        self.queued = 0
+        self.rejected = 0
+        self.throttled = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updatedAt) * self.rate
+            )
+        self.updatedAt = now
+
+    def estimateWait(self, now: float) -> float:
+        """How long a request joining the queue now would wait for"""
+        self._refill(now)
+        wait = max(self.pausedUntil - now, 0)
+        if self.rate is not None:
+            wait += max(self.queued + 1 - self.tokens, 0) / self.rate
+        return wait
+
+    def _reject(self, wait: float) -> RateLimitedError:
+        self.rejected += 1
+        return RateLimitedError(self.host, wait)
+
+    async def acquire(self) -> None:
+        """Waits until a request may be sent to the host"""
+        now = time.monotonic()
+        if self.queued >= self.maxQueue:
+            raise self._reject(self.estimateWait(now))
+        estimate = self.estimateWait(now)
+        if estimate > self.maxWait:
+            raise self._reject(estimate)
+        if estimate > 0:
+            self.throttled += 1
+        deadline = now + self.maxWait
+        self.queued += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = max(self.pausedUntil - now, 0)
+                    if wait == 0:
+                        if self.rate is None:
+                            return
+                        if self.tokens >= 1:
+                            self.tokens -= 1
+                            return
+                        wait = (1 - self.tokens) / self.rate
+                    if now + wait > deadline:
+                        raise self._reject(wait)
+                    await asyncio.sleep(wait)
+        finally:
+            self.queued -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Stops sending requests to the host for the given number of seconds"""
+        now = time.monotonic()
+        self.pausedUntil = max(self.pausedUntil, now + min(seconds, MAX_PAUSE))
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """Applies the rate limit state the host sent back with a response"""
+        retryAfter = headers.get("Retry-After") or headers.get(
+            "X-RateLimit-Retry-After"
+        )
+        if retryAfter is not None:
+            seconds = parseRetryAfter(retryAfter)
+            if seconds is not None and seconds > 1e9:
+                seconds -= time.time()
+            if seconds is not None and seconds > 0:
+                self.pause(seconds)
+                return
+        if headers.get("X-RateLimit-Remaining") == "0":
+            seconds = parseReset(headers.get("X-RateLimit-Reset", ""))
+            if seconds is not None and seconds > 0:
+                self.pause(seconds)
+                return
+        if status == 429:
+            # Rate limited without being told for how long, so wait out
+            # roughly one token's worth
+            self.tokens = 0
+            self.pause(1 / self.rate if self.rate is not None else 1)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queued": self.queued,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+            "paused_for": max(self.pausedUntil - time.monotonic(), 0),
+        }
+
+
+class RateLimiter:
+    """Holds a token bucket per upstream host, shared by every request Rin makes"""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        maxQueue: int = DEFAULT_MAX_QUEUE,
+        maxWait: float = DEFAULT_MAX_WAIT,
+    ):
+        self.limits = SERVICE_LIMITS if limits is None else limits
+        self.maxQueue = maxQueue
+        self.maxWait = maxWait
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def bucketFor(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            rate, burst = self.limits.get(host, (None, 1))
+            bucket = self.buckets[host] = TokenBucket(
+                host, rate, burst, self.maxQueue, self.maxWait
+            )
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Waits for the URL's host to allow another request
+
+        Raises:
+            RateLimitedError: The host's queue is full, or the wait would be too long
+        """
+        await self.bucketFor(url).acquire()
+
+    def update(self, url: str, status: int, headers: Mapping[str, str]) -> None:
+        self.bucketFor(url).update(status, headers)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Queue depth and how often requests were held back, per host"""
+        return {host: bucket.stats() for host, bucket in self.buckets.items()}
@@ -0,0 +1,214 @@
+import asyncio
+import collections
+from typing import Any, Deque, List, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+Argument = Union[bytes, str, int, float]
+
+
+class RESPError(Exception):
+    """An error reply from the server"""
+
+
+def encodeCommand(*args: Argument) -> bytes:
+    """Encodes a command as an array of bulk strings, the way clients send them"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def readReply(reader: asyncio.StreamReader) -> Any:
+    """Reads one RESP2 value off the stream
+
+    Error replies are returned as RESPError rather than raised, so that one
+    failed command doesn't throw off the replies to the ones after it.
+
+    Raises:
+        ConnectionError: The stream ended or sent something that isn't RESP
+    """
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed in the middle of a reply")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        return RESPError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(rest)
+        if length < 0:
+            return None
+        return [await readReply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply type {kind!r}")
+
+
+class RESPConnection:
+    """A single connection that pipelines every command sent on it
+
+    Commands are written as soon as they're sent, without waiting on the
+    replies to earlier ones. Replies come back in order, and a reader task
+    hands each one to the command it answers.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._pending: Deque[asyncio.Future] = collections.deque()
+        self._readerTask = asyncio.create_task(self._readReplies())
+
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        password: Optional[str] = None,
+        db: int = 0,
+    ) -> "RESPConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+        setup = []
+        if password is not None:
+            setup.append(("AUTH", password))
+        if db:
+            setup.append(("SELECT", db))
+        try:
+            for reply in await asyncio.gather(*connection.send(setup)):
+                if isinstance(reply, RESPError):
+                    raise reply
+        except BaseException:
+            await connection.close()
+            raise
+        return connection
+
+    @property
+    def closed(self) -> bool:
+        return self._readerTask.done()
+
+    def send(self, commands: Sequence[Sequence[Argument]]) -> List[asyncio.Future]:
+        """Writes the commands in one go, returning a future for each one's reply"""
+        if self.closed:
+            raise ConnectionError("Connection is closed")
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in commands]
+        self._pending.extend(futures)
+        self.writer.write(b"".join(encodeCommand(*command) for command in commands))
+        return futures
+
+    async def _readReplies(self) -> None:
+        try:
+            while True:
+                reply = await readReply(self.reader)
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(reply)
+        except (ConnectionError, asyncio.IncompleteReadError, OSError, IndexError) as e:
+            error = ConnectionError(f"Connection to the cache server was lost: {e!r}")
+        except asyncio.CancelledError:
+            error = ConnectionError("Connection was closed")
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+        self.writer.close()
+
+    async def close(self) -> None:
+        self._readerTask.cancel()
+        try:
+            await self._readerTask
+        except asyncio.CancelledError:
+            pass
+
+
+class RESPClient:
+    """A small client for servers that speak the Redis protocol (RESP2)
+
+    Commands are spread over a pool of ``poolSize`` connections, each of
+    which pipelines whatever is sent on it, so concurrent callers never
+    wait for a free connection. Connections are opened on first use and
+    reopened if they drop. Every call gives up after ``timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        password: Optional[str] = None,
+        db: int = 0,
+        poolSize: int = 4,
+        timeout: float = 1.0,
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.db = db
+        self.timeout = timeout
+        self._connections: List[Optional[RESPConnection]] = [None] * poolSize
+        self._locks = [asyncio.Lock() for _ in range(poolSize)]
+        self._next = 0
+
+    @classmethod
+    def fromURL(cls, url: str, **kwargs) -> "RESPClient":
+        """Builds a client from a ``redis://[:password@]host[:port][/db]`` URL"""
+        parts = urlsplit(url)
+        db = parts.path.strip("/")
+        return cls(
+            parts.hostname or "127.0.0.1",
+            parts.port or 6379,
+            password=parts.password,
+            db=int(db) if db else 0,
+            **kwargs,
+        )
+
+    async def _connection(self) -> RESPConnection:
+        index = self._next
+        self._next = (index + 1) % len(self._connections)
+        connection = self._connections[index]
+        if connection is None or connection.closed:
+            async with self._locks[index]:
+                connection = self._connections[index]
+                if connection is None or connection.closed:
+                    connection = await RESPConnection.open(
+                        self.host, self.port, self.password, self.db
+                    )
+                    self._connections[index] = connection
+        return connection
+
+    async def pipeline(self, commands: Sequence[Sequence[Argument]]) -> List[Any]:
+        """Sends several commands in one write, returning their replies in order
+
+        Raises:
+            RESPError: The server answered one of the commands with an error
+            ConnectionError: The server couldn't be reached
+            asyncio.TimeoutError: The replies took longer than ``timeout``
+        """
+        if not commands:
+            return []
+
+        async def run() -> List[Any]:
+            connection = await self._connection()
+            return await asyncio.gather(*connection.send(commands))
+
+        replies = await asyncio.wait_for(run(), self.timeout)
+        for reply in replies:
+            if isinstance(reply, RESPError):
+                raise reply
+        return replies
+
+    async def execute(self, *args: Argument) -> Any:
+        return (await self.pipeline([args]))[0]
+
+    async def close(self) -> None:
+        for connection in self._connections:
+            if connection is not None:
+                await connection.close()
+        self._connections = [None] * len(self._connections)
@@ -0,0 +1,80 @@
+import heapq
+import os
+import random
+from typing import AsyncIterable, Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# One generator for the whole process, seeded from the OS. Nothing Rin picks
+# at random has to be unpredictable, so this doesn't need to be ``secrets``
+_rng = random.Random()  # nosec B311
+
+# A forked child would otherwise draw the exact same numbers as its parent
+os.register_at_fork(after_in_child=_rng.seed)
+
+
+def seed(value: Optional[int] = None) -> None:
+    """Reseeds the process' generator, for draws that can be replayed exactly"""
+    _rng.seed(value)
+
+
+def choice(items: Sequence[T], weights: Optional[Sequence[float]] = None) -> T:
+    """Picks one item, optionally weighted
+
+    Raises:
+        IndexError: ``items`` is empty
+    """
+    if not items:
+        raise IndexError("Cannot choose from an empty sequence")
+    if weights is None:
+        return items[_rng.randrange(len(items))]
+    return _rng.choices(items, weights=weights)[0]
+
+
+def sample(
+    items: Sequence[T], k: int, weights: Optional[Sequence[float]] = None
+) -> List[T]:
+    """Picks up to ``k`` distinct items, optionally weighted
+
+    Weighted draws give every item a key of ``u ** (1 / weight)`` and keep the
+    ``k`` largest (Efraimidis and Spirakis), which is the same as drawing one
+    item at a time and leaving it out of the following draws. Items with a
+    weight of zero are never picked.
+    """
+    if weights is None:
+        return _rng.sample(items, min(k, len(items)))
+    if len(weights) != len(items):
+        raise ValueError("The number of weights does not match the items")
+    keys = [
+        (_rng.random() ** (1 / weight), index)
+        for index, weight in enumerate(weights)
+        if weight > 0
+    ]
+    return [items[index] for _, index in heapq.nlargest(k, keys)]
+
+
+async def reservoir(
+    items: AsyncIterable[T],
+    k: int = 1,
+    predicate: Optional[Callable[[T], bool]] = None,
+) -> List[T]:
+    """Picks up to ``k`` items uniformly from an async stream of unknown length
+
+    Only the ``k`` items picked so far are held on to (Algorithm R), so the
+    stream is never buffered in full. Items that fail ``predicate`` are
+    skipped without counting towards the draw.
+    """
+    picked: List[T] = []
+    seen = 0
+    async for item in items:
+        if predicate is not None and not predicate(item):
+            continue
+        seen += 1
+        if len(picked) < k:
+            picked.append(item)
+        else:
+            index = _rng.randrange(seen)
+            if index < k:
+                picked[index] = item
+    _rng.shuffle(picked)
+    return picked
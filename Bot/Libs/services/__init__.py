@@ -0,0 +1,76 @@
+from typing import Dict
+
+from Libs.http import HTTPClient
+from Libs.services.advice import AdviceSlipClient
+from Libs.services.base import ServiceClient
+from Libs.services.bluealliance import BlueAllianceClient
+from Libs.services.github import GitHubClient, GitHubGraphQLClient
+from Libs.services.jikan import JikanClient
+from Libs.services.jisho import JishoClient
+from Libs.services.mangadex import MangaDexClient
+from Libs.services.mcsrvstat import McSrvStatClient
+from Libs.services.memeapi import MemeAPIClient
+from Libs.services.modrinth import ModrinthClient
+from Libs.services.spiget import SpigetClient
+from Libs.services.tenor import TenorClient
+from Libs.services.twitter import TwitterClient
+from Libs.services.waifu import WaifuImClient, WaifuPicsClient
+from Libs.services.youtube import YouTubeClient
+
+
+class Services:
+    """Holds one client per upstream service, all sharing the same HTTPClient
+
+    ``close`` has to be awaited before the HTTPClient's session is closed.
+    """
+
+    def __init__(self, http: HTTPClient):
+        self.advice = AdviceSlipClient(http)
+        self.blueAlliance = BlueAllianceClient(http)
+        self.github = GitHubClient(http)
+        self.githubGraphQL = GitHubGraphQLClient(http)
+        self.jikan = JikanClient(http)
+        self.jisho = JishoClient(http)
+        self.mangadex = MangaDexClient(http)
+        self.mcsrvstat = McSrvStatClient(http)
+        self.memeAPI = MemeAPIClient(http)
+        self.modrinth = ModrinthClient(http)
+        self.spiget = SpigetClient(http)
+        self.tenor = TenorClient(http)
+        self.twitter = TwitterClient(http)
+        self.waifuIm = WaifuImClient(http)
+        self.waifuPics = WaifuPicsClient(http)
+        self.youtube = YouTubeClient(http)
+
+    async def close(self) -> None:
+        await self.githubGraphQL.close()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Request counts and latency for each service"""
+        return {
+            name: client.stats()
+            for name, client in vars(self).items()
+            if isinstance(client, ServiceClient)
+        }
+
+
+__all__ = [
+    "AdviceSlipClient",
+    "BlueAllianceClient",
+    "GitHubClient",
+    "GitHubGraphQLClient",
+    "JikanClient",
+    "JishoClient",
+    "MangaDexClient",
+    "McSrvStatClient",
+    "MemeAPIClient",
+    "ModrinthClient",
+    "ServiceClient",
+    "Services",
+    "SpigetClient",
+    "TenorClient",
+    "TwitterClient",
+    "WaifuImClient",
+    "WaifuPicsClient",
+    "YouTubeClient",
+]
@@ -0,0 +1,13 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class AdviceSlipClient(ServiceClient):
+    """Client for the Advice Slip API"""
+
+    baseURL = "https://api.adviceslip.com"
+    # Every endpoint is random, so none of them are hedged
+    hedge = False
+
+    async def randomAdvice(self) -> Response:
+        return await self.get("/advice", ttl=0)
@@ -0,0 +1,78 @@
+import time
+from typing import Dict, Optional
+
+from Libs.budget import DEFAULT_BUDGET, DEFAULT_TIMEOUT, CallBudget
+from Libs.http import HTTPClient, Response
+
+
+class ServiceClient:
+    """Base class for the client of a single upstream service
+
+    Subclasses set ``baseURL`` (and ``headers`` if the service needs auth)
+    and add one method per endpoint the cogs use. Every request goes through
+    the shared HTTPClient, so pooling, caching and coalescing apply to all of
+    them, and requests that fail with a connection error, a timeout, a 429 or
+    a 5xx status are retried with backoff. Retries of a 429 wait out whatever
+    the rate limiter was told by the upstream first.
+
+    Each call has a latency ``budget`` that covers every attempt, so retries
+    stop once it's spent, and each attempt is bounded by ``timeout``. Both
+    are spent through a CallBudget, which GraphQL clients share. GETs are
+    hedged when ``hedge`` is set, which suits idempotent endpoints whose
+    upstream answers from a cache or a database. Clients for upstreams that
+    are slow on a miss or have a tight quota turn it off, since a hedge
+    there only doubles the quota spent. Random endpoints (``ttl=0``) are
+    never hedged.
+    """
+
+    baseURL: str = ""
+    budget: float = DEFAULT_BUDGET
+    timeout = DEFAULT_TIMEOUT
+    hedge: bool = True
+    retries: int = 2
+    backoff: float = 0.25
+
+    def __init__(self, http: HTTPClient):
+        self.http = http
+        self.headers: Optional[Dict[str, str]] = None
+        self.calls = CallBudget(self.budget, self.timeout, self.retries, self.backoff)
+        self.requests = 0
+        self.totalLatency = 0.0
+
+    async def get(
+        self, path: str, params: Optional[Dict] = None, ttl: Optional[int] = None
+    ) -> Response:
+        """Sends a GET request to the service, retrying it if it fails
+
+        Args:
+            path (str): The path to request, relative to ``baseURL``
+            params (Optional[Dict]): The query parameters to send
+            ttl (Optional[int]): Overrides the host's cache TTL. Use 0 for endpoints that return random results
+        """
+        url = f"{self.baseURL}{path}"
+        self.requests += 1
+        start = time.perf_counter()
+        try:
+            return await self.calls.run(
+                lambda timeout: self.http.get(
+                    url,
+                    params=params,
+                    headers=self.headers,
+                    ttl=ttl,
+                    timeout=timeout,
+                    hedge=self.hedge and ttl != 0,
+                ),
+                retryResult=lambda r: r.status >= 500 or r.status == 429,
+            )
+        finally:
+            self.totalLatency += time.perf_counter() - start
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "retries": self.calls.retried,
+            "failures": self.calls.failures,
+            "avg_latency_ms": self.totalLatency / self.requests * 1000
+            if self.requests
+            else 0.0,
+        }
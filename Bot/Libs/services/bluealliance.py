@@ -0,0 +1,29 @@
+import os
+
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class BlueAllianceClient(ServiceClient):
+    """Client for The Blue Alliance's v3 API"""
+
+    baseURL = "https://www.thebluealliance.com/api/v3"
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.headers = {"X-TBA-Auth-Key": os.getenv("Blue_Alliance_API_Key")}
+
+    async def team(self, teamNumber: int) -> Response:
+        return await self.get(f"/team/frc{teamNumber}")
+
+    async def teamEvents(self, teamNumber: int) -> Response:
+        return await self.get(f"/team/frc{teamNumber}/events")
+
+    async def teamEventMatches(self, teamNumber: int, eventKey: str) -> Response:
+        return await self.get(f"/team/frc{teamNumber}/event/{eventKey}/matches")
+
+    async def eventRankings(self, eventKey: str) -> Response:
+        return await self.get(f"/event/{eventKey}/rankings")
+
+    async def eventMatches(self, eventKey: str) -> Response:
+        return await self.get(f"/event/{eventKey}/matches")
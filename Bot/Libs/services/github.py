@@ -0,0 +1,312 @@
+import os
+from typing import Dict, Optional
+
+from gql import gql
+from gql.transport.exceptions import TransportQueryError
+from graphql import DocumentNode
+from Libs.cache import authScopeOf, makeKey
+from Libs.gqlclient import GraphQLClient, QueryResult
+from Libs.http import HTTPClient, Response
+from Libs.services.base import ServiceClient
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Each query only selects the fields the cog's embeds render
+REPO_QUERY = gql(
+    """
+    query Repo($owner: String!, $name: String!) {
+        repository(owner: $owner, name: $name) {
+            name
+            description
+            url
+            homepageUrl
+            isFork
+            isArchived
+            stargazerCount
+            forkCount
+            createdAt
+            updatedAt
+            pushedAt
+            watchers {
+                totalCount
+            }
+            issues(states: OPEN) {
+                totalCount
+            }
+            languages(first: 5, orderBy: {field: SIZE, direction: DESC}) {
+                nodes {
+                    name
+                }
+            }
+            licenseInfo {
+                name
+            }
+            latestRelease {
+                name
+                tagName
+                url
+                publishedAt
+            }
+            owner {
+                login
+                url
+                avatarUrl
+                ... on User {
+                    name
+                    followers {
+                        totalCount
+                    }
+                }
+                ... on Organization {
+                    name
+                }
+            }
+        }
+    }
+    """
+)
+
+USER_QUERY = gql(
+    """
+    query User($login: String!) {
+        repositoryOwner(login: $login) {
+            __typename
+            login
+            url
+            avatarUrl
+            repositories(privacy: PUBLIC) {
+                totalCount
+            }
+            ... on User {
+                name
+                bio
+                company
+                location
+                websiteUrl
+                twitterUsername
+                createdAt
+                followers {
+                    totalCount
+                }
+                following {
+                    totalCount
+                }
+            }
+            ... on Organization {
+                name
+                description
+                location
+                websiteUrl
+                twitterUsername
+                createdAt
+            }
+        }
+    }
+    """
+)
+
+LATEST_RELEASE_QUERY = gql(
+    """
+    query LatestRelease($owner: String!, $name: String!) {
+        repository(owner: $owner, name: $name) {
+            latestRelease {
+                name
+                description
+                url
+                tagName
+                isPrerelease
+                createdAt
+                publishedAt
+                author {
+                    login
+                }
+                releaseAssets(first: 25) {
+                    nodes {
+                        name
+                        contentType
+                        size
+                        downloadCount
+                        downloadUrl
+                        createdAt
+                        uploadedBy {
+                            login
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+)
+
+# Issues and pull requests share their numbers, so either can be asked for.
+# Their states are different enums, which can't share a field name
+ISSUE_QUERY = gql(
+    """
+    query Issue($owner: String!, $name: String!, $number: Int!) {
+        repository(owner: $owner, name: $name) {
+            issueOrPullRequest(number: $number) {
+                __typename
+                ... on Issue {
+                    title
+                    issueState: state
+                }
+                ... on PullRequest {
+                    title
+                    pullRequestState: state
+                }
+                ... on Comment {
+                    body
+                    createdAt
+                    updatedAt
+                    author {
+                        login
+                        url
+                        avatarUrl
+                    }
+                }
+                ... on Labelable {
+                    labels(first: 25) {
+                        nodes {
+                            name
+                        }
+                    }
+                }
+                ... on Assignable {
+                    assignees(first: 25) {
+                        nodes {
+                            login
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+)
+
+
+class GitHubClient(ServiceClient):
+    """Client for GitHub's REST API"""
+
+    baseURL = "https://api.github.com"
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.headers = {
+            "Authorization": f"token {os.getenv('GitHub_API_Access_Token')}",
+            "accept": "application/vnd.github.v3+json",
+        }
+
+    async def searchRepos(self, query: str) -> Response:
+        params = {"q": query, "sort": "stars", "order": "desc", "per_page": 25}
+        return await self.get("/search/repositories", params=params)
+
+    async def searchUsers(self, query: str) -> Response:
+        params = {"q": query, "sort": "stars", "order": "desc", "per_page": 25}
+        return await self.get("/search/users", params=params)
+
+    async def issues(self, owner: str, repo: str, state: str) -> Response:
+        params = {
+            "state": state.lower(),
+            "sort": "created",
+            "per_page": 25,
+            "direction": "desc",
+        }
+        return await self.get(f"/repos/{owner}/{repo}/issues", params=params)
+
+    async def releases(self, owner: str, repo: str) -> Response:
+        return await self.get(
+            f"/repos/{owner}/{repo}/releases", params={"per_page": 25}
+        )
+
+
+class GitHubGraphQLClient:
+    """Client for GitHub's GraphQL API
+
+    Lookups that would take several REST calls (a repo along with its latest
+    release, languages and owner) are a single query here. Results are
+    cached like REST responses from the same host, and identical queries in
+    flight are only sent once. GitHub's schema is far too large to be worth
+    introspecting, so queries aren't validated locally.
+
+    Anything GitHub couldn't find comes back as None instead of raising.
+    """
+
+    def __init__(self, http: HTTPClient):
+        self.http = http
+        self.headers = {
+            "Authorization": f"bearer {os.getenv('GitHub_API_Access_Token')}"
+        }
+        self.client = GraphQLClient(
+            GITHUB_GRAPHQL_URL,
+            lambda: self.http.session.connector,
+            headers=self.headers,
+            limiter=self.http.limiter,
+            fetchSchema=False,
+            hedger=self.http.hedger,
+        )
+
+    async def execute(self, name: str, document: DocumentNode, params: Dict) -> Dict:
+        """Runs one of the queries above, serving it from the cache when possible
+
+        Args:
+            name (str): The query's operation name, which keys it in the cache
+            document (DocumentNode): The query itself
+            params (Dict): The query's variables
+        """
+        key = makeKey(
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            {"operation": name, "variables": params},
+            authScopeOf(self.headers),
+        )
+
+        async def fetch() -> QueryResult:
+            try:
+                return QueryResult(await self.client.execute(document, params))
+            except TransportQueryError as e:
+                # GitHub answers with errors for anything that doesn't exist
+                if e.errors and all(
+                    error.get("type") == "NOT_FOUND" for error in e.errors
+                ):
+                    return QueryResult(e.data or {})
+                raise
+
+        result = await self.http.cache.getOrFetch(
+            key,
+            lambda: self.http.inflight.do(key, fetch),
+            self.http.cache.ttlFor(GITHUB_GRAPHQL_URL),
+        )
+        return result.data
+
+    async def repo(self, owner: str, repo: str) -> Optional[Dict]:
+        data = await self.execute("Repo", REPO_QUERY, {"owner": owner, "name": repo})
+        return data.get("repository")
+
+    async def user(self, login: str) -> Optional[Dict]:
+        data = await self.execute("User", USER_QUERY, {"login": login})
+        return data.get("repositoryOwner")
+
+    async def latestRelease(self, owner: str, repo: str) -> Optional[Dict]:
+        data = await self.execute(
+            "LatestRelease", LATEST_RELEASE_QUERY, {"owner": owner, "name": repo}
+        )
+        return (data.get("repository") or {}).get("latestRelease")
+
+    async def issue(self, owner: str, repo: str, number: int) -> Optional[Dict]:
+        """An issue or pull request, with its state under ``state`` either way"""
+        data = await self.execute(
+            "Issue", ISSUE_QUERY, {"owner": owner, "name": repo, "number": number}
+        )
+        item = (data.get("repository") or {}).get("issueOrPullRequest")
+        if item is None:
+            return None
+        # A copy, as the cached result is shared
+        return {
+            **item,
+            "state": item.get("issueState") or item.get("pullRequestState"),
+        }
+
+    async def close(self) -> None:
+        await self.client.close()
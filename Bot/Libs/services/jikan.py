@@ -0,0 +1,37 @@
+import aiohttp
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class JikanClient(ServiceClient):
+    """Client for Jikan, the unofficial MyAnimeList API"""
+
+    baseURL = "https://api.jikan.moe/v4"
+    # Jikan scrapes MyAnimeList on a cache miss, which regularly takes a few seconds
+    budget = 15
+    timeout = aiohttp.ClientTimeout(total=8, connect=2, sock_read=7)
+    # A hedge would only be another slow scrape, and would eat into the 3/s quota
+    hedge = False
+
+    async def searchAnime(self, name: str) -> Response:
+        params = {"limit": 25, "q": name, "sfw": "true", "order_by": "title"}
+        return await self.get("/anime/", params=params)
+
+    async def searchManga(self, name: str) -> Response:
+        params = {"limit": 25, "q": name, "sfw": "true", "order_by": "title"}
+        return await self.get("/manga", params=params)
+
+    async def randomAnime(self) -> Response:
+        return await self.get("/random/anime", ttl=0)
+
+    async def randomManga(self) -> Response:
+        return await self.get("/random/manga", ttl=0)
+
+    async def season(self, year: int, season: str) -> Response:
+        return await self.get(f"/seasons/{year}/{season.lower()}")
+
+    async def upcomingSeason(self) -> Response:
+        return await self.get("/seasons/upcoming")
+
+    async def user(self, username: str) -> Response:
+        return await self.get(f"/users/{username}")
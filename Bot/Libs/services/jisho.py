@@ -0,0 +1,11 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class JishoClient(ServiceClient):
+    """Client for Jisho's word search API"""
+
+    baseURL = "https://jisho.org/api/v1"
+
+    async def searchWords(self, keyword: str) -> Response:
+        return await self.get("/search/words", params={"keyword": keyword})
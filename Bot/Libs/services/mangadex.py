@@ -0,0 +1,49 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class MangaDexClient(ServiceClient):
+    """Client for the MangaDex API"""
+
+    baseURL = "https://api.mangadex.org"
+
+    async def searchManga(self, title: str) -> Response:
+        params = {
+            "title": title,
+            "publicationDemographic[]": "none",
+            "contentRating[]": "safe",
+            "order[title]": "asc",
+            "limit": 25,
+            "includes[]": ["cover_art", "manga", "tags", "author"],
+        }
+        return await self.get("/manga/", params=params)
+
+    async def randomManga(self) -> Response:
+        return await self.get(
+            "/manga/random", params={"includes[]": ["cover_art"]}, ttl=0
+        )
+
+    async def mangaFeed(self, mangaID: str) -> Response:
+        params = {
+            "contentRating[]": ["safe"],
+            "translatedLanguage[]": ["en"],
+            "order[chapter]": "asc",
+            "includes[]": ["scanlation_group"],
+        }
+        return await self.get(f"/manga/{mangaID}/feed", params=params)
+
+    async def atHomeServer(self, chapterID: str) -> Response:
+        return await self.get(f"/at-home/server/{chapterID}")
+
+    async def searchGroups(self, name: str) -> Response:
+        params = {
+            "limit": 25,
+            "name": name,
+            "order[name]": "asc",
+            "order[relevance]": "desc",
+        }
+        return await self.get("/group", params=params)
+
+    async def searchAuthors(self, name: str) -> Response:
+        params = {"limit": 25, "name": name, "order[name]": "asc"}
+        return await self.get("/author", params=params)
@@ -0,0 +1,20 @@
+import aiohttp
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class McSrvStatClient(ServiceClient):
+    """Client for the mcsrvstat.us Minecraft server status API"""
+
+    baseURL = "https://api.mcsrvstat.us"
+    # Uncached lookups ping the Minecraft server itself, so a second copy of
+    # a slow request would only be just as slow
+    budget = 12
+    timeout = aiohttp.ClientTimeout(total=10, connect=2, sock_read=9)
+    hedge = False
+
+    async def javaServer(self, server: str) -> Response:
+        return await self.get(f"/2/{server}")
+
+    async def bedrockServer(self, server: str) -> Response:
+        return await self.get(f"/bedrock/2/{server}")
@@ -0,0 +1,13 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class MemeAPIClient(ServiceClient):
+    """Client for the Meme API, which serves random posts from meme subreddits"""
+
+    baseURL = "https://meme-api.herokuapp.com"
+    # Every endpoint is random, so none of them are hedged
+    hedge = False
+
+    async def gimme(self, subreddit: str, amount: int) -> Response:
+        return await self.get(f"/gimme/{subreddit}/{amount}", ttl=0)
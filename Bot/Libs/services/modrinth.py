@@ -0,0 +1,35 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class ModrinthClient(ServiceClient):
+    """Client for Modrinth's v2 API"""
+
+    baseURL = "https://api.modrinth.com/v2"
+
+    async def searchMods(self, query: str, modloader: str, limit: int = 25) -> Response:
+        params = {
+            "query": query,
+            "index": "relevance",
+            "limit": limit,
+            "facets": f'[["categories:{modloader.lower()}"]]',
+        }
+        return await self.get("/search", params=params)
+
+    async def project(self, projectID: str) -> Response:
+        return await self.get(f"/project/{projectID}")
+
+    async def projectVersions(
+        self, projectID: str, modloader: str, gameVersion: str
+    ) -> Response:
+        params = {
+            "loaders": f"[{modloader.lower()}]",
+            "game_versions": f"[{gameVersion}]",
+        }
+        return await self.get(f"/project/{projectID}/version", params=params)
+
+    async def user(self, username: str) -> Response:
+        return await self.get(f"/user/{username}")
+
+    async def userProjects(self, username: str) -> Response:
+        return await self.get(f"/user/{username}/projects")
@@ -0,0 +1,17 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class SpigetClient(ServiceClient):
+    """Client for Spiget, the SpigotMC resource API"""
+
+    baseURL = "https://api.spiget.org/v2"
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.headers = {
+            "user-agent": "Mozilla/5.0 (Linux; Android 6.0.1; Moto G (4)) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/103.0.0.0 Mobile Safari/537.36"
+        }
+
+    async def searchResources(self, name: str) -> Response:
+        return await self.get(f"/search/resources/{name.lower()}", params={"size": 25})
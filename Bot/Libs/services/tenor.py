@@ -0,0 +1,44 @@
+import os
+
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class TenorClient(ServiceClient):
+    """Client for Tenor's v2 API"""
+
+    baseURL = "https://tenor.googleapis.com/v2"
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.key = os.getenv("Tenor_API_V2_Key")
+
+    async def search(
+        self, query: str, limit: int = 25, random: bool = False
+    ) -> Response:
+        params = {
+            "q": query,
+            "key": self.key,
+            "contentfilter": "medium",
+            "limit": limit,
+            "media_filter": "minimal",
+        }
+        if random:
+            params["random"] = "true"
+        return await self.get("/search", params=params, ttl=0 if random else None)
+
+    async def featured(self) -> Response:
+        params = {
+            "key": self.key,
+            "contentfilter": "medium",
+            "limit": 25,
+            "media_filter": "minimal",
+        }
+        return await self.get("/featured", params=params)
+
+    async def searchSuggestions(self, query: str) -> Response:
+        params = {"key": self.key, "q": query, "limit": 25}
+        return await self.get("/search_suggestions", params=params)
+
+    async def trendingTerms(self) -> Response:
+        return await self.get("/trending_terms", params={"key": self.key, "limit": 25})
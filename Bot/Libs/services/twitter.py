@@ -0,0 +1,29 @@
+import os
+
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class TwitterClient(ServiceClient):
+    """Client for Twitter's v1.1 and v2 APIs"""
+
+    baseURL = "https://api.twitter.com"
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.headers = {"Authorization": f"Bearer {os.getenv('Twitter_Bearer_Token')}"}
+
+    async def recentTweets(self, username: str) -> Response:
+        params = {
+            "query": f"from:{username}",
+            "expansions": "author_id,attachments.media_keys",
+            "tweet.fields": "created_at,public_metrics,id",
+            "user.fields": "name,profile_image_url,username",
+            "media.fields": "preview_image_url",
+            "max_results": 25,
+        }
+        return await self.get("/2/tweets/search/recent", params=params)
+
+    async def searchUsers(self, query: str) -> Response:
+        params = {"q": query, "count": 1}
+        return await self.get("/1.1/users/search.json", params=params)
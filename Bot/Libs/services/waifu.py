@@ -0,0 +1,31 @@
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class WaifuImClient(ServiceClient):
+    """Client for the waifu.im API"""
+
+    baseURL = "https://api.waifu.im"
+    # Every endpoint is random, so none of them are hedged
+    hedge = False
+
+    async def randomImage(self, tag: str, many: bool = False) -> Response:
+        params = {
+            "selected_tags": tag,
+            "is_nsfw": "false",
+            "excluded_tags": "oppai",
+        }
+        if many:
+            params["many"] = "true"
+        return await self.get("/random/", params=params, ttl=0)
+
+
+class WaifuPicsClient(ServiceClient):
+    """Client for the waifu.pics API"""
+
+    baseURL = "https://api.waifu.pics"
+    # Every endpoint is random, so none of them are hedged
+    hedge = False
+
+    async def sfwImage(self, category: str) -> Response:
+        return await self.get(f"/sfw/{category}", ttl=0)
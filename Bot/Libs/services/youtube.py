@@ -0,0 +1,65 @@
+import os
+
+from Libs.http import Response
+from Libs.services.base import ServiceClient
+
+
+class YouTubeClient(ServiceClient):
+    """Client for the YouTube Data v3 API"""
+
+    baseURL = "https://www.googleapis.com/youtube/v3"
+    # Every hedge would be charged against the daily quota
+    hedge = False
+
+    def __init__(self, http):
+        super().__init__(http)
+        self.key = os.getenv("YouTube_API_Key")
+
+    async def searchVideos(self, query: str) -> Response:
+        params = {
+            "key": self.key,
+            "part": "snippet",
+            "type": "video",
+            "maxResults": "25",
+            "q": query,
+            "channelType": "any",
+            "videoLicense": "any",
+            "safeSearch": "strict",
+        }
+        return await self.get("/search", params=params)
+
+    async def searchChannel(self, query: str) -> Response:
+        params = {
+            "key": self.key,
+            "part": "snippet",
+            "type": "channel",
+            "maxResults": "1",
+            "q": query,
+            "channelType": "any",
+            "videoLicense": "any",
+            "order": "relevance",
+        }
+        return await self.get("/search", params=params)
+
+    async def searchPlaylistChannel(self, query: str) -> Response:
+        params = {
+            "key": self.key,
+            "part": "snippet",
+            "type": "playlists",
+            "maxResults": "1",
+            "q": query,
+        }
+        return await self.get("/search", params=params)
+
+    async def channel(self, channelID: str) -> Response:
+        params = {"key": self.key, "part": "snippet,statistics", "id": channelID}
+        return await self.get("/channels", params=params)
+
+    async def playlists(self, channelID: str) -> Response:
+        params = {
+            "key": self.key,
+            "part": "snippet,contentDetails",
+            "channelId": channelID,
+            "maxResults": 25,
+        }
+        return await self.get("/playlists", params=params)
@@ -0,0 +1,284 @@
+import itertools
+import logging
+import random
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from types import SimpleNamespace
+from typing import IO, Any, Dict, List, Optional
+
+import aiohttp
+import orjson
+
+TRACE_FORMATS = ("jsonl", "chrome")
+
+_currentTrace: ContextVar[Optional["Trace"]] = ContextVar("rinTrace", default=None)
+_currentSpan: ContextVar[Optional["Span"]] = ContextVar("rinSpan", default=None)
+
+
+class NoopSpan:
+    """Stands in for a span whenever nothing is being traced"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+    def finish(self) -> None:
+        return None
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Span:
+    """A timed stage of a trace, such as a fetch, a parse or a render
+
+    Starts as soon as it's created. Used as a context manager, any spans
+    opened inside it become its children. Spans that can't be scoped to a
+    block, like aiohttp's connection hooks, are ended with ``finish``.
+    """
+
+    __slots__ = ("trace", "id", "parent", "name", "attrs", "start", "end", "_token")
+
+    def __init__(
+        self, trace: "Trace", name: str, attrs: Dict[str, Any], parent: Optional[int]
+    ):
+        self.trace = trace
+        self.id = len(trace.spans)
+        self.parent = parent
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self._token = None
+        trace.spans.append(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _currentSpan.set(self)
+        return self
+
+    def __exit__(self, excType, exc, tb) -> None:
+        if excType is not None:
+            self.attrs["error"] = excType.__name__
+        _currentSpan.reset(self._token)
+        self.finish()
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+
+class Trace:
+    """Every span recorded while running a single command"""
+
+    def __init__(self, tracer: "Tracer", id: int, name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.id = id
+        self.wallStart = time.time()
+        self.spans: List[Span] = []
+        self.root = Span(self, name, attrs, None)
+        self._token = None
+
+    def set(self, **attrs: Any) -> None:
+        self.root.set(**attrs)
+
+    def span(self, name: str, attrs: Dict[str, Any]) -> Span:
+        parent = _currentSpan.get()
+        return Span(self, name, attrs, parent.id if parent is not None else None)
+
+    def __enter__(self) -> "Trace":
+        self._token = _currentTrace.set(self)
+        self.root.__enter__()
+        return self
+
+    def __exit__(self, excType, exc, tb) -> None:
+        self.root.__exit__(excType, exc, tb)
+        _currentTrace.reset(self._token)
+        self.tracer.record(self)
+
+    def toDict(self) -> Dict[str, Any]:
+        """The trace as a single JSON lines record, with span times relative to its start"""
+        origin = self.root.start
+        end = self.root.end
+        return {
+            "trace": self.id,
+            "name": self.root.name,
+            "timestamp": self.wallStart,
+            "duration_ms": (end - origin) * 1000,
+            "attrs": self.root.attrs,
+            "spans": [
+                {
+                    "id": span.id,
+                    "parent": span.parent,
+                    "name": span.name,
+                    "start_ms": (span.start - origin) * 1000,
+                    # Spans still open when the command returns (a cancelled
+                    # hedge, say) are cut off where the trace ends
+                    "duration_ms": ((span.end or end) - span.start) * 1000,
+                    "attrs": span.attrs,
+                }
+                for span in self.spans[1:]
+            ],
+        }
+
+    def toChromeEvents(self) -> List[Dict[str, Any]]:
+        """The trace as complete ("X") events for chrome://tracing or Perfetto
+
+        Each command gets its own row, named after the command.
+        """
+        offset = self.wallStart - self.root.start
+        events = [
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": 1,
+                "tid": self.id,
+                "args": {"name": f"{self.root.name} #{self.id}"},
+            }
+        ]
+        for span in self.spans:
+            end = span.end or self.root.end
+            events.append(
+                {
+                    "ph": "X",
+                    "name": span.name,
+                    "cat": self.root.name,
+                    "pid": 1,
+                    "tid": self.id,
+                    "ts": (span.start + offset) * 1e6,
+                    "dur": (end - span.start) * 1e6,
+                    "args": span.attrs,
+                }
+            )
+        return events
+
+
+def span(name: str, **attrs: Any):
+    """Opens a span in the trace of the command that's running
+
+    Returns a shared no-op span when there isn't one, so marking a stage
+    costs a single context variable lookup while tracing is disabled.
+    """
+    trace = _currentTrace.get()
+    if trace is None:
+        return NOOP_SPAN
+    return trace.span(name, attrs)
+
+
+def tracing() -> bool:
+    """Whether the code that's running is part of a trace"""
+    return _currentTrace.get() is not None
+
+
+class Tracer:
+    """Records a trace per command and writes them to a file for offline analysis
+
+    Disabled unless ``path`` is given. ``format`` is either ``jsonl``, one
+    trace per line, or ``chrome``, the Trace Event Format that
+    chrome://tracing and Perfetto open. ``sampleRate`` is the fraction of
+    commands that get traced.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, format: str = "jsonl", sampleRate: float = 1
+    ):
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Trace format must be one of {TRACE_FORMATS}")
+        self.path = Path(path) if path else None
+        self.format = format
+        self.sampleRate = sampleRate
+        self.recorded = 0
+        self.logger = logging.getLogger("rinbot")
+        self._ids = itertools.count(1)
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None and self.sampleRate > 0
+
+    def trace(self, name: str, **attrs: Any):
+        """Starts tracing a command, if it's sampled"""
+        if not self.enabled or random.random() >= self.sampleRate:  # nosec
+            return NOOP_SPAN
+        return Trace(self, next(self._ids), name, attrs)
+
+    def open(self) -> IO[bytes]:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+            if self.format == "chrome" and self._file.tell() == 0:
+                # The closing bracket is optional in the Trace Event Format,
+                # which lets events be appended for as long as Rin runs
+                self._file.write(b"[\n")
+            self.logger.info(f"Writing {self.format} traces to {self.path}")
+        return self._file
+
+    def record(self, trace: Trace) -> None:
+        try:
+            file = self.open()
+            if self.format == "chrome":
+                for event in trace.toChromeEvents():
+                    file.write(orjson.dumps(event, default=str) + b",\n")
+            else:
+                file.write(orjson.dumps(trace.toDict(), default=str) + b"\n")
+            file.flush()
+            self.recorded += 1
+        except OSError as e:
+            self.logger.warning(f"Failed to write trace: {e}")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def createTraceConfig() -> aiohttp.TraceConfig:
+    """aiohttp hooks that split a request's time into DNS, connect and TLS, and the rest
+
+    The connection span covers the TCP and TLS handshakes, and only shows
+    up when no pooled connection could be reused.
+    """
+
+    async def startSpan(name: str, ctx: SimpleNamespace, **attrs: Any) -> None:
+        setattr(ctx, name, span(name, **attrs))
+
+    async def endSpan(name: str, ctx: SimpleNamespace) -> None:
+        getattr(ctx, name, NOOP_SPAN).finish()
+
+    async def onDNSStart(session, ctx, params) -> None:
+        await startSpan("dns", ctx, host=params.host)
+
+    async def onDNSEnd(session, ctx, params) -> None:
+        await endSpan("dns", ctx)
+
+    async def onDNSCacheHit(session, ctx, params) -> None:
+        await startSpan("dns", ctx, host=params.host, cached=True)
+        await endSpan("dns", ctx)
+
+    async def onConnectStart(session, ctx, params) -> None:
+        await startSpan("connect", ctx)
+
+    async def onConnectEnd(session, ctx, params) -> None:
+        await endSpan("connect", ctx)
+
+    async def onConnectionReused(session, ctx, params) -> None:
+        span("connect", reused=True).finish()
+
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(onDNSStart)
+    config.on_dns_resolvehost_end.append(onDNSEnd)
+    config.on_dns_cache_hit.append(onDNSCacheHit)
+    config.on_connection_create_start.append(onConnectStart)
+    config.on_connection_create_end.append(onConnectEnd)
+    config.on_connection_reuseconn.append(onConnectionReused)
+    return config
@@ -1,26 +1,32 @@
-import logging
-import os
-
-import discord
-import uvloop
-from dotenv import load_dotenv
-from rincore import RinCore
-
-load_dotenv()
-
-TOKEN = os.getenv("Hanako_Token")
-intents = discord.Intents.default()
-intents.message_content = True
-
-bot = RinCore(intents=intents)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] | %(asctime)s >> %(message)s",
-    datefmt="[%m/%d/%Y] [%I:%M:%S %p %Z]",
-)
-logging.getLogger("gql").setLevel(logging.WARNING)
-
-if __name__ == "__main__":
-    uvloop.install()
-    bot.run(TOKEN)
+import logging
+import os
+
+import discord
+import uvloop
+from dotenv import load_dotenv
+from rincore import RinCore
+
+load_dotenv()
+
+TOKEN = os.getenv("Hanako_Token")
+intents = discord.Intents.default()
+intents.message_content = True
+
+
+def main() -> None:
+    # Offload workers are spawned, and re-run this script as __mp_main__, so
+    # the bot has to be built here rather than at import time
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] | %(asctime)s >> %(message)s",
+        datefmt="[%m/%d/%Y] [%I:%M:%S %p %Z]",
+    )
+    logging.getLogger("gql").setLevel(logging.WARNING)
+
+    bot = RinCore(intents=intents)
+    uvloop.install()
+    bot.run(TOKEN)
+
+
+if __name__ == "__main__":
+    main()
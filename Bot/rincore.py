@@ -1,11 +1,36 @@
 import logging
+import math
+import os
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
+import aiohttp
 import discord
-from discord.ext import ipc
 from discord.ext.ipc.objects import ClientPayload
 from discord.ext.ipc.server import Server
+from Libs.autodefer import LatencyPredictor, RinContext, commandPath, resolveCommand
+from Libs.cache import ResponseCache
+from Libs.catalog import CommandCatalog
+from Libs.hedging import Hedger
+from Libs.http import HTTPClient, createSession
+from Libs.ipcserver import RinIPCServer
+from Libs.lazycogs import LazyCogLoader, LazyCommand
+from Libs.looplag import SLOW_CALLBACK_THRESHOLD, LoopMonitor
+from Libs.metrics import (
+    COMMAND_ERRORS,
+    COMMAND_INVOCATIONS,
+    COMMAND_LATENCY,
+    REGISTRY,
+    MetricsServer,
+)
+from Libs.offload import OFFLOAD_THRESHOLD, Offloader
+from Libs.persistentcache import PersistentResponseCache, RESPStore, SQLiteStore
+from Libs.ratelimit import RateLimiter
+from Libs.resp import RESPClient
+from Libs.services import Services
+from Libs.singleflight import SingleFlight
+from Libs.tracing import Tracer, createTraceConfig, span
 
 
 class RinCore(discord.Bot):
@@ -18,17 +43,243 @@ class RinCore(discord.Bot):
             *args,
             **kwargs,
         )
-        self.ipc = ipc.Server(self, secret_key="test")  # nosec
+        self.ipc = RinIPCServer(self, secret_key="test")  # nosec
         self.logger = logging.getLogger("rinbot")
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache = self.createCache(
+            os.getenv("Response_Cache_Path"), os.getenv("Response_Cache_URL")
+        )
+        self.inflight = SingleFlight()
+        self.rateLimiter = RateLimiter()
+        self.hedger = Hedger()
+        self.latencyPredictor = LatencyPredictor()
+        self.loopMonitor = LoopMonitor(
+            threshold=float(
+                os.getenv("Slow_Callback_Threshold", SLOW_CALLBACK_THRESHOLD)
+            )
+        )
+        self.offloader = Offloader(
+            os.getenv("Offload_Mode", "thread"),
+            threshold=int(os.getenv("Offload_Threshold", OFFLOAD_THRESHOLD)),
+        )
+        self.httpClient: Optional[HTTPClient] = None
+        self.services: Optional[Services] = None
+        # Metrics are only served once a port has been given to serve them on
+        metricsPort = os.getenv("Metrics_Port")
+        self.metricsServer = (
+            MetricsServer(os.getenv("Metrics_Host", "127.0.0.1"), int(metricsPort))
+            if metricsPort
+            else None
+        )
+        self.tracer = Tracer(
+            os.getenv("Trace_Output"),
+            os.getenv("Trace_Format", "jsonl"),
+            float(os.getenv("Trace_Sample_Rate", 1)),
+        )
+        self.cogLoader = LazyCogLoader(self, Path(__file__).parent.joinpath("Cogs"))
+        self.catalog = CommandCatalog(self)
+        self.registerGauges()
+        self.add_listener(self.recordCommandError, "on_application_command_error")
         self.loadCogs()
         self.loop.create_task(self.ipc.start())
 
+    def openUpstreams(self, connector: Optional[aiohttp.TCPConnector] = None) -> None:
+        """Creates the shared upstream HTTP session and the service clients using it
+
+        Must be called while the event loop is running. ``connector`` replaces
+        the default pooled connector, which is how the benchmarks point every
+        upstream at a local stub server.
+        """
+        if self.session is None or self.session.closed:
+            self.session = createSession(
+                connector,
+                traceConfigs=[createTraceConfig()] if self.tracer.enabled else None,
+            )
+            self.httpClient = HTTPClient(
+                self.session, self.cache, self.inflight, self.rateLimiter, self.hedger
+            )
+            self.services = Services(self.httpClient)
+
+    async def start(self, *args, **kwargs) -> None:
+        """Creates the shared upstream HTTP session before connecting to Discord"""
+        self.openUpstreams()
+        self.loopMonitor.start()
+        if self.metricsServer is not None:
+            try:
+                await self.metricsServer.start()
+            except OSError as e:
+                self.logger.warning(f"Metrics endpoint could not be started: {e}")
+        await super().start(*args, **kwargs)
+
+    async def close(self) -> None:
+        """Closes the Discord connection, then the shared upstream HTTP session
+
+        Cogs that hold clients of their own close them in ``closeClients``,
+        which is awaited here, as py-cord doesn't unload cogs on shutdown.
+        """
+        await super().close()
+        for cog in list(self.cogs.values()):
+            closeClients = getattr(cog, "closeClients", None)
+            if closeClients is not None:
+                await closeClients()
+        if self.metricsServer is not None:
+            await self.metricsServer.close()
+        await self.loopMonitor.close()
+        self.offloader.close()
+        self.tracer.close()
+        if self.services is not None:
+            await self.services.close()
+        await self.cache.close()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    @staticmethod
+    def createCache(path: Optional[str], url: Optional[str] = None) -> ResponseCache:
+        """The API cache, backed by whichever store is configured
+
+        ``url`` points at a Redis protocol server shared with other Rin
+        processes, and ``path`` at a SQLite database that survives restarts.
+        The server wins if both are given. Without either, the cache only
+        lives in memory.
+        """
+        if url:
+            return PersistentResponseCache(RESPStore(RESPClient.fromURL(url)))
+        if path:
+            return PersistentResponseCache(SQLiteStore(path))
+        return ResponseCache()
+
+    def registerGauges(self) -> None:
+        """Exposes the state of Rin's shared caches and limiters as gauges"""
+        REGISTRY.gauge(
+            "rin_cache_entries",
+            "Responses held in the API cache",
+            lambda: [({}, len(self.cache))],
+        )
+        REGISTRY.gauge(
+            "rin_cache_lookups",
+            "API cache lookups by outcome",
+            lambda: [
+                ({"outcome": outcome}, count)
+                for outcome, count in self.cache.stats().items()
+                if outcome not in ("entries", "bytes")
+            ],
+        )
+        REGISTRY.gauge(
+            "rin_singleflight_coalesced",
+            "Requests that shared an identical in-flight request",
+            lambda: [({}, self.inflight.coalesced)],
+        )
+        REGISTRY.gauge(
+            "rin_ratelimit_queued",
+            "Requests waiting on a host's rate limit",
+            lambda: [
+                ({"host": host}, stats["queued"])
+                for host, stats in self.rateLimiter.stats().items()
+            ],
+        )
+        REGISTRY.gauge(
+            "rin_ratelimit_rejected",
+            "Requests turned away by a host's rate limit",
+            lambda: [
+                ({"host": host}, stats["rejected"])
+                for host, stats in self.rateLimiter.stats().items()
+            ],
+        )
+        REGISTRY.gauge(
+            "rin_hedged_requests",
+            "Requests that had a hedge sent, by which attempt won",
+            lambda: [
+                ({"host": host, "winner": winner}, stats[f"{winner}_wins"])
+                for host, stats in self.hedger.stats().items()
+                for winner in ("primary", "hedge")
+            ],
+        )
+        REGISTRY.gauge(
+            "rin_gateway_latency_seconds",
+            "Discord websocket heartbeat latency",
+            lambda: [] if math.isnan(self.latency) else [({}, self.latency)],
+        )
+        REGISTRY.gauge(
+            "rin_cog_import_seconds",
+            "How long each imported cog took to load",
+            lambda: [
+                ({"cog": extension}, elapsed)
+                for extension, (elapsed, _) in self.cogLoader.profile.items()
+            ],
+        )
+
+    async def recordCommandError(
+        self, ctx: discord.ApplicationContext, error: discord.DiscordException
+    ) -> None:
+        error = getattr(error, "original", error)
+        COMMAND_ERRORS.labels(commandPath(ctx)[0], type(error).__name__).inc()
+
+    async def get_application_context(
+        self, interaction: discord.Interaction, cls=RinContext
+    ) -> discord.ApplicationContext:
+        return await super().get_application_context(interaction, cls=cls)
+
+    async def invoke_application_command(self, ctx: discord.ApplicationContext) -> None:
+        """Invokes the command, deferring it first if it's predicted to be slow
+
+        Each command's run time is tracked, and the ones that are likely to
+        miss Discord's 3 second window are deferred before they start. The
+        whole run is traced when tracing is enabled, and any step of it that
+        blocks the event loop is reported by the loop monitor. A command whose
+        cog was deferred is swapped for the real one, importing the cog.
+        """
+        if isinstance(ctx.command, LazyCommand):
+            ctx.command = self.cogLoader.resolve(ctx.command)
+        name, subcommands = commandPath(ctx)
+        with self.tracer.trace(name, guild=ctx.guild_id) as trace:
+            deferred = False
+            if self.latencyPredictor.shouldDefer(
+                name, resolveCommand(ctx.command, subcommands)
+            ):
+                try:
+                    with span("defer"):
+                        await ctx.defer()
+                    deferred = True
+                except discord.HTTPException as e:
+                    self.logger.warning(f"Failed to defer {name}: {e}")
+            COMMAND_INVOCATIONS.labels(name).inc()
+            start = time.perf_counter()
+            try:
+                await self.loopMonitor.timed(
+                    name, super().invoke_application_command(ctx)
+                )
+                # py-cord only sets this on application contexts once a command fails
+                if getattr(ctx, "command_failed", False):
+                    trace.set(failed=True)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.latencyPredictor.observe(name, elapsed)
+                COMMAND_LATENCY.labels(name, str(deferred).lower()).observe(elapsed)
+
+    def add_cog(self, cog: discord.Cog, *, override: bool = False) -> None:
+        super().add_cog(cog, override=override)
+        self.catalog.invalidate()
+
+    def remove_cog(self, name: str) -> Optional[discord.Cog]:
+        cog = super().remove_cog(name)
+        self.catalog.invalidate()
+        return cog
+
     def loadCogs(self):
-        """Rin's system to load cogs"""
-        cogsPath = Path(__file__).parent.joinpath("Cogs")
-        for cog in cogsPath.rglob("*.py"):
-            self.load_extension(f"Cogs.{cog.name[:-3]}")
-            self.logger.debug(f"Loaded Cog: {cog.name[:-3]}")
+        """Rin's system to load cogs
+
+        With ``Lazy_Cogs`` set to true, cogs that only have commands are
+        registered from the cog manifest and imported the first time one of
+        their commands is used.
+        """
+        self.cogLoader.load(lazy=os.getenv("Lazy_Cogs", "false").lower() == "true")
+        self.cogLoader.report()
+
+    def cogDescriptions(self) -> Dict[str, Optional[str]]:
+        """Every cog's description by its name, including cogs that haven't been imported yet"""
+        descriptions = self.cogLoader.deferredCogs()
+        descriptions.update({name: cog.__doc__ for name, cog in self.cogs.items()})
+        return descriptions
 
     async def on_ready(self):
         self.logger.info(f"{self.user.name} is ready to go!")
@@ -40,46 +291,27 @@ class RinCore(discord.Bot):
         # return {"message": "yes"}
 
     @Server.route()
-    async def get_all_commands(self, data: ClientPayload) -> Dict:
-        allCommands = [
-            {
-                "name": items.qualified_name,
-                "description": items.description,
-                "module": items.module.replace("Cogs.", "")
-                if items.module != "discord.commands.core"
-                else "None",
-                "parent_name": items.parent.name
-                if items.parent is not None
-                else "None",
-            }
-            for items in self.walk_application_commands()
-        ]
-        return {"count": len(allCommands), "data": allCommands}
+    async def get_all_commands(self, data: ClientPayload) -> bytes:
+        return self.catalog.allCommands()
+
+    @Server.route()
+    async def get_command(self, data: ClientPayload) -> bytes:
+        return self.catalog.command(data.name)
 
     @Server.route()
-    async def get_command(self, data: ClientPayload) -> Dict:
-        command = self.get_application_command(data.name)
-        return {
-            "name": command.qualified_name,
-            "description": command.description,
-            "module": command.module.replace("Cogs.", "")
-            if command.module != "discord.commands.core"
-            else "None",
-            "parent_name": command.parent.name
-            if command.parent is not None
-            else "None",
-        }
+    async def get_commands(self, data: ClientPayload) -> bytes:
+        """Several commands by their qualified names, in one round trip"""
+        return self.catalog.commands(list(data.names))
 
     @Server.route()
-    async def get_all_cogs(self, data: ClientPayload) -> Dict:
-        allCogs = [
-            {"name": cogName, "description": cog.__doc__}
-            for cogName, cog in self.cogs.items()
-            if cogName not in ["InteractionFailureHandler", "IPCServer"]
-        ]
-        return {"count": len(allCogs), "cogs": allCogs}
+    async def get_all_cogs(self, data: ClientPayload) -> bytes:
+        return self.catalog.allCogs()
+
+    # Named apart from the route so it doesn't shadow Bot.get_cog
+    @Server.route(name="get_cog")
+    async def get_cog_info(self, data: ClientPayload) -> bytes:
+        return self.catalog.cog(data.name)
 
     @Server.route()
-    async def get_cog(self, data: ClientPayload) -> Dict:
-        cog = await self.get_cog(data.name)
-        return {"name": cog.qualified_name, "description": cog.description}
+    async def get_catalog_version(self, data: ClientPayload) -> Dict:
+        return {"version": self.catalog.version}
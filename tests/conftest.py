@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The bot imports its own packages (Libs, Cogs) relative to Bot/
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("Bot")))
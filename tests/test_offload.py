@@ -0,0 +1,175 @@
+import asyncio
+import gc
+import os
+import sys
+import threading
+from typing import Any, Dict, List
+
+import discord
+import orjson
+import pytest
+from Libs.http import Response
+from Libs.offload import Offloader, field, renderEmbed
+from Libs.paginator import LazyPages, LazyPaginator, errorPage
+from multidict import CIMultiDict
+
+RECORDS = [{"title": f"Issue {i}", "state": "open"} for i in range(3)]
+MALFORMED = [RECORDS[0], {"title": "Issue 1"}, RECORDS[2]]
+
+# Transforms have to be module level, so that process workers can unpickle them
+transformed: List[str] = []
+
+
+def whereTransformed(data: Any) -> Dict[str, Any]:
+    return {
+        "pid": os.getpid(),
+        "thread": threading.current_thread().name,
+        "records": len(data),
+    }
+
+
+def workerState() -> Dict[str, Any]:
+    """Runs in a worker, reporting its entry script and how many bots it holds"""
+    rincore = sys.modules.get("rincore")
+    return {
+        "main": getattr(sys.modules.get("__mp_main__"), "__file__", None),
+        "bots": sum(isinstance(obj, rincore.RinCore) for obj in gc.get_objects())
+        if rincore is not None
+        else 0,
+        "preloaded": "Cogs.jisho" in sys.modules,
+    }
+
+
+def issueModel(item: Dict) -> Dict:
+    transformed.append(item["title"])
+    return {"title": item["title"], "fields": [field("State", item["state"])]}
+
+
+def issues(data: Dict) -> List:
+    return data["issues"]
+
+
+def makeResponse(data: Any) -> Response:
+    return Response(200, CIMultiDict(), orjson.dumps(data))
+
+
+@pytest.fixture(autouse=True)
+def clearTransformed():
+    transformed.clear()
+
+
+@pytest.fixture(params=["thread", "process"])
+def offloaded(request):
+    """An offloader that sends every payload to its pool"""
+    offloader = Offloader(request.param, workers=1, threshold=0)
+    yield offloader
+    offloader.close()
+
+
+def test_small_payload_is_transformed_on_the_loop():
+    offloader = Offloader("process", threshold=1024 * 1024)
+    response = makeResponse(RECORDS)
+
+    async def run():
+        return await asyncio.gather(
+            *(offloader.transform(response, whereTransformed) for _ in range(2))
+        )
+
+    first, second = asyncio.run(run())
+    assert first == {
+        "pid": os.getpid(),
+        "thread": threading.current_thread().name,
+        "records": 3,
+    }
+    assert second is first
+    assert response.viewModels[whereTransformed] is first
+    assert offloader._executor is None
+
+
+def test_large_payload_is_transformed_in_the_pool(offloaded):
+    response = makeResponse(RECORDS)
+    first = asyncio.run(offloaded.transform(response, whereTransformed))
+    second = asyncio.run(offloaded.transform(response, whereTransformed))
+
+    if offloaded.mode == "process":
+        assert first["pid"] != os.getpid()
+    else:
+        assert first["pid"] == os.getpid()
+        assert first["thread"].startswith("rin-offload")
+    assert first["records"] == 3
+    assert second is first
+    assert response.viewModels[whereTransformed] is first
+
+
+def test_small_payload_records_are_transformed_when_looked_up():
+    offloader = Offloader(threshold=1024 * 1024)
+    response = makeResponse({"issues": MALFORMED})
+    models = asyncio.run(offloader.transformEach(response, issueModel, issues))
+
+    assert len(models) == 3
+    assert transformed == []
+    assert models[2]["title"] == "Issue 2"
+    assert transformed == ["Issue 2"]
+    with pytest.raises(KeyError):
+        models[1]
+    assert models[0]["title"] == "Issue 0"
+    assert asyncio.run(offloader.transformEach(response, issueModel, issues)) is models
+    assert response.viewModels[(issueModel, issues)] is models
+
+
+def test_large_payload_records_are_transformed_in_the_pool(offloaded):
+    response = makeResponse({"issues": MALFORMED})
+    models = asyncio.run(offloaded.transformEach(response, issueModel, issues))
+
+    # Every record is transformed at once, including the malformed one
+    if offloaded.mode == "process":
+        assert transformed == []
+    else:
+        assert transformed == ["Issue 0", "Issue 1", "Issue 2"]
+    assert [models[0]["title"], models[2]["title"]] == ["Issue 0", "Issue 2"]
+    with pytest.raises(KeyError):
+        models[1]
+    assert asyncio.run(offloaded.transformEach(response, issueModel, issues)) is models
+    assert response.viewModels[(issueModel, issues)] is models
+
+
+@pytest.mark.parametrize("threshold", [0, 1024 * 1024])
+def test_malformed_record_gets_an_error_page(threshold):
+    offloader = Offloader(threshold=threshold)
+    shown: List[discord.Embed] = []
+
+    class Message:
+        async def edit(self, **kwargs) -> None:
+            shown.append(kwargs["embeds"][0])
+
+    async def run() -> None:
+        models = await offloader.transformEach(
+            makeResponse({"issues": MALFORMED}), issueModel, issues
+        )
+        paginator = LazyPaginator(pages=LazyPages(models, renderEmbed))
+        paginator.get_page_content(paginator.pages[0])
+        paginator.message = Message()
+        await paginator.goto_page(1)
+        await paginator.goto_page(2)
+
+    asyncio.run(run())
+    offloader.close()
+    assert shown[0].description == errorPage().description
+    assert shown[1].title == "Issue 2"
+
+
+def test_process_workers_do_not_build_rincore(monkeypatch):
+    import rinbot
+    from Cogs.jisho import wordModel
+
+    # What spawn re-runs in every worker is whatever __main__ is
+    monkeypatch.setitem(sys.modules, "__main__", rinbot)
+    offloader = Offloader("process", workers=1, threshold=0)
+    try:
+        state = offloader._getExecutor(wordModel).submit(workerState).result(timeout=60)
+    finally:
+        offloader.close()
+
+    assert os.path.basename(state["main"]) == "rinbot.py"
+    assert state["bots"] == 0
+    assert state["preloaded"]
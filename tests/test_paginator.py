@@ -0,0 +1,80 @@
+import asyncio
+from typing import List
+
+import discord
+import pytest
+from Libs.paginator import LazyPages, LazyPaginator, errorPage
+
+
+class Message:
+    """Stands in for the paginator's message, keeping the embeds of each edit"""
+
+    def __init__(self):
+        self.edits: List[List[discord.Embed]] = []
+
+    async def edit(self, **kwargs) -> None:
+        self.edits.append(kwargs["embeds"])
+
+
+def makeRecords(total: int) -> List[dict]:
+    return [{"title": f"Issue {i}", "state": "open"} for i in range(total)]
+
+
+def renderIssue(item: dict) -> discord.Embed:
+    return discord.Embed(title=item["title"]).add_field(
+        name="State", value=item["state"]
+    )
+
+
+def flip(records: List[dict], pageNumbers: List[int]) -> List[discord.Embed]:
+    """Shows the first page, then goes to each page the way the buttons do"""
+
+    async def run() -> List[discord.Embed]:
+        paginator = LazyPaginator(
+            pages=LazyPages(records, renderIssue), loop_pages=True
+        )
+        paginator.get_page_content(paginator.pages[0])
+        paginator.message = Message()
+        for page in pageNumbers:
+            await paginator.goto_page(page)
+        return [embeds[0] for embeds in paginator.message.edits]
+
+    return asyncio.run(run())
+
+
+def test_malformed_page_shows_error_page():
+    records = makeRecords(3)
+    del records[1]["state"]
+
+    shown = flip(records, [1, 2, 1])
+
+    assert shown[0].description == errorPage().description
+    assert shown[1].title == "Issue 2"
+    assert shown[2] is shown[0]
+
+
+def test_pages_render_once():
+    calls = []
+
+    def render(item: dict) -> discord.Embed:
+        calls.append(item["title"])
+        return renderIssue(item)
+
+    async def run() -> None:
+        paginator = LazyPaginator(pages=LazyPages(makeRecords(3), render))
+        paginator.get_page_content(paginator.pages[0])
+        paginator.message = Message()
+        for page in (1, 0, 1):
+            await paginator.goto_page(page)
+
+    asyncio.run(run())
+    assert calls == ["Issue 0", "Issue 1"]
+
+
+def test_first_page_error_is_raised():
+    records = makeRecords(2)
+    del records[0]["title"]
+    pages = LazyPages(records, renderIssue)
+
+    with pytest.raises(KeyError):
+        pages[0]